@@ -0,0 +1,213 @@
+"""Shared MCP client session helper for the `scripts/mcp_*.py` tools.
+
+Picks the client transport from the server URL:
+- `.../mcp` -> streamable HTTP (single bidirectional HTTP channel)
+- anything else (default `.../sse`) -> SSE + POST message channel
+
+The bundled server speaks SSE (`--transport sse`), so SSE stays the default.
+
+`ensure_tools()` validates that a server exposes the tools a script needs and
+remembers a positive answer per server identity, so repeat runs skip `tools/list`.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+if TYPE_CHECKING:
+    from mcp.client.session import ClientSession
+
+
+# Each transport keeps one pooled httpx client for the whole session, so every
+# tool call reuses the same keep-alive connection. Only the idle read timeout on
+# the event stream needs tuning: slow reports can exceed the 5-minute default.
+_SSE_READ_TIMEOUT_SECONDS = float(os.getenv("MCP_SSE_READ_TIMEOUT_SECONDS", "300"))
+
+
+def _is_streamable_http(url: str) -> bool:
+    return url.rstrip("/").endswith("/mcp")
+
+
+@asynccontextmanager
+async def open_session(
+    url: str, *, required: set[str] | None = None
+) -> AsyncIterator[ClientSession]:
+    """Open a transport for `url`, yield an initialized `ClientSession`.
+
+    When `required` is given, the server is checked for those tools first
+    (see `ensure_tools`).
+    """
+    # mcp is imported here so `--help`/argument errors skip loading the client stack.
+    from mcp.client.session import ClientSession
+
+    if _is_streamable_http(url):
+        # Requires mcp>=1.8 (streamable HTTP client).
+        from mcp.client.streamable_http import streamablehttp_client
+
+        transport = streamablehttp_client(url, sse_read_timeout=_SSE_READ_TIMEOUT_SECONDS)
+        async with transport as (read, write, _):
+            async with ClientSession(read, write) as session:
+                init_result = await session.initialize()
+                if required:
+                    await ensure_tools(session, url, init_result, required)
+                yield session
+        return
+
+    from mcp.client.sse import sse_client
+
+    async with sse_client(url, sse_read_timeout=_SSE_READ_TIMEOUT_SECONDS) as (read, write):
+        async with ClientSession(read, write) as session:
+            init_result = await session.initialize()
+            if required:
+                await ensure_tools(session, url, init_result, required)
+            yield session
+
+
+TOOLS_CACHE_PATH = Path("~/.cache/yandex-direct-metrica-mcp/tools.json")
+
+
+def _server_key(url: str, init_result: Any) -> str:
+    info = getattr(init_result, "serverInfo", None)
+    parts = (
+        url,
+        getattr(info, "name", ""),
+        getattr(info, "version", ""),
+        getattr(init_result, "protocolVersion", ""),
+    )
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+def _read_tools_cache(path: Path) -> dict[str, list[str]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def ensure_tools(
+    session: ClientSession,
+    url: str,
+    init_result: Any,
+    required: set[str],
+    *,
+    cache_path: Path | None = TOOLS_CACHE_PATH,
+) -> None:
+    """Raise if the server lacks any of `required`; cache hits skip `tools/list`.
+
+    The cache is keyed by URL + server name/version + protocol version. Tool
+    visibility flags (e.g. `MCP_PUBLIC_READONLY`) are not part of the key, so a
+    stale hit only skips this guard; the tool call itself still fails loudly.
+    """
+    path = cache_path.expanduser() if cache_path is not None else None
+    key = _server_key(url, init_result)
+    cache = _read_tools_cache(path) if path is not None else {}
+    if required.issubset(cache.get(key, ())):
+        return
+
+    tools = await session.list_tools()
+    names = frozenset(t.name for t in tools.tools)
+    if not required.issubset(names):
+        raise RuntimeError(f"Server missing tools: {sorted(required - names)}")
+
+    if path is not None:
+        cache[key] = sorted(names)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:
+            pass  # best effort; the probe simply runs again next time
+
+
+# Direct returns at most 10 000 objects per `get`; `LimitedBy` marks a cut-off page.
+DIRECT_PAGE_LIMIT = 10_000
+
+
+def _tool_result(res: Any) -> dict:
+    """`result` of a tool call; raises on tool errors so callers never see a silent partial list."""
+    if getattr(res, "isError", False):
+        raise RuntimeError(res.content[0].text if res.content else "Tool call failed")
+    payload = getattr(res, "structuredContent", None) or _loads(res.content[0].text)
+    if "error" in payload:
+        raise RuntimeError(payload["error"])
+    if "result" not in payload:
+        raise RuntimeError(f"Tool payload has no result: {sorted(payload)}")
+    return payload["result"] or {}
+
+
+def _page_arguments(arguments: dict, offset: int, limit: int) -> dict:
+    if arguments.get("params"):
+        # Raw params override bypasses the tool's `page` argument.
+        params = {**arguments["params"], "Page": {"Limit": limit, "Offset": offset}}
+        return {**arguments, "params": params}
+    return {**arguments, "page": {"limit": limit, "offset": offset}}
+
+
+async def list_all(
+    session: ClientSession,
+    tool: str,
+    arguments: dict,
+    key: str,
+    *,
+    page_size: int = DIRECT_PAGE_LIMIT,
+) -> list[dict]:
+    """Collect `result[key]` across all Direct pages of a `direct.list_*` tool.
+
+    The first page is fetched alone, so single-page results cost one call. Once
+    `LimitedBy` shows there is more, pages are requested two at a time: the
+    second one is speculative and simply comes back empty past the end.
+    """
+    import anyio
+
+    async def fetch(offset: int) -> tuple[list[dict], Any]:
+        res = await session.call_tool(tool, arguments=_page_arguments(arguments, offset, page_size))
+        result = _tool_result(res)
+        return result.get(key) or [], result.get("LimitedBy")
+
+    items, limited_by = await fetch(0)
+    offset = page_size
+    while limited_by is not None:
+        pages: list[tuple[list[dict], Any]] = [([], None), ([], None)]
+
+        async def fetch_into(slot: int, page_offset: int) -> None:
+            pages[slot] = await fetch(page_offset)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fetch_into, 0, offset)
+            tg.start_soon(fetch_into, 1, offset + page_size)
+        for page_items, limited_by in pages:
+            items.extend(page_items)
+            if limited_by is None:
+                break
+        offset += 2 * page_size
+    return items
+
+
+# Direct accepts at most 1000 objects per ads.update call.
+DIRECT_UPDATE_BATCH = 1000
+
+
+async def update_ads_in_batches(session: ClientSession, items: list[dict]) -> list[Any]:
+    """Send `direct.update_ads` in 1000-item batches concurrently; results keep batch order."""
+    import anyio
+
+    chunks = [items[i : i + DIRECT_UPDATE_BATCH] for i in range(0, len(items), DIRECT_UPDATE_BATCH)]
+    results: list[Any] = [None] * len(chunks)
+
+    async def send(slot: int, chunk: list[dict]) -> None:
+        results[slot] = await session.call_tool("direct.update_ads", arguments={"items": chunk})
+
+    async with anyio.create_task_group() as tg:
+        for slot, chunk in enumerate(chunks):
+            tg.start_soon(send, slot, chunk)
+    return results
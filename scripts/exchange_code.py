@@ -7,10 +7,33 @@ import os
 import sys
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 TOKEN_URL = "https://oauth.yandex.ru/token"
 
 
+def _build_session() -> requests.Session:
+    # Reuse one pooled session so repeated exchanges skip the TCP+TLS handshake.
+    # POST is not in urllib3's default retryable methods, so only connection
+    # failures are retried (an authorization code is single-use).
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=int(os.getenv("OAUTH_POOL_MAXSIZE", "10")),
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Exchange code for tokens")
     parser.add_argument("--code", help="Authorization code")
@@ -20,35 +43,39 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# CLI argument -> environment fallback, checked in this order.
+_FIELD_ENV_KEYS = (
+    ("code", "YANDEX_AUTH_CODE"),
+    ("client_id", "YANDEX_CLIENT_ID"),
+    ("client_secret", "YANDEX_CLIENT_SECRET"),
+    ("redirect_uri", "YANDEX_REDIRECT_URI"),
+)
+_REQUIRED_FIELDS = ("code", "client_id", "client_secret")
+
+
 def main() -> int:
     args = parse_args()
-    code = args.code or os.getenv("YANDEX_AUTH_CODE")
-    client_id = args.client_id or os.getenv("YANDEX_CLIENT_ID")
-    client_secret = args.client_secret or os.getenv("YANDEX_CLIENT_SECRET")
-    redirect_uri = args.redirect_uri or os.getenv("YANDEX_REDIRECT_URI")
-
-    missing = []
-    if not code:
-        missing.append("code")
-    if not client_id:
-        missing.append("client_id")
-    if not client_secret:
-        missing.append("client_secret")
+    env = os.environ
+    values = {
+        field: getattr(args, field) or env.get(env_key)
+        for field, env_key in _FIELD_ENV_KEYS
+    }
+    missing = [field for field in _REQUIRED_FIELDS if not values[field]]
     if missing:
         print(f"Missing required fields: {', '.join(missing)}")
         return 1
 
     data = {
         "grant_type": "authorization_code",
-        "code": code,
-        "client_id": client_id,
-        "client_secret": client_secret,
+        "code": values["code"],
+        "client_id": values["client_id"],
+        "client_secret": values["client_secret"],
     }
-    if redirect_uri:
-        data["redirect_uri"] = redirect_uri
+    if values["redirect_uri"]:
+        data["redirect_uri"] = values["redirect_uri"]
 
     try:
-        response = requests.post(TOKEN_URL, data=data, timeout=30)
+        response = _SESSION.post(TOKEN_URL, data=data, timeout=(5, 30))
         response.raise_for_status()
     except requests.RequestException as exc:
         print(f"Token exchange failed: {exc}")
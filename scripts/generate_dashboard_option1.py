@@ -6,27 +6,32 @@ It exists for convenience when you want a one-liner to generate HTML+JSON into a
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import anyio
 import click
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import open_session
 
 
 DEFAULT_SSE_URL = "http://localhost:8000/sse"
 
 
 def _parse_text_response(res: Any) -> dict[str, Any]:
-    # MCP client returns a list of content items; our server uses TextContent(JSON-string).
-    if isinstance(res, list) and res and isinstance(res[0], dict) and "text" in res[0]:
-        return json.loads(res[0]["text"])
-    if isinstance(res, list) and res and hasattr(res[0], "text"):
-        return json.loads(res[0].text)
-    raise ValueError("Unexpected MCP response shape")
+    # The client already decoded `structuredContent` with the JSON-RPC frame.
+    structured = getattr(res, "structuredContent", None)
+    if structured:
+        return structured
+    # Otherwise our server returns TextContent(JSON-string); accept the
+    # `CallToolResult` wrapper as well as a bare list of content items.
+    item = getattr(res, "content", res)[0]
+    return _loads(item["text"] if isinstance(item, dict) else item.text)
 
 
 @dataclass(frozen=True)
@@ -35,7 +40,7 @@ class Inputs:
     account_id: str | None
     direct_client_login: str | None
     counter_id: str | None
-    goal_ids: list[str]
+    goal_ids: tuple[str, ...]
     date_from: str
     date_to: str
     output_dir: Path
@@ -59,24 +64,40 @@ async def _run(inputs: Inputs) -> tuple[str | None, str | None]:
     if inputs.dashboard_slug:
         args["dashboard_slug"] = inputs.dashboard_slug
     if inputs.goal_ids:
-        args["goal_ids"] = inputs.goal_ids
+        args["goal_ids"] = list(inputs.goal_ids)
 
-    async with sse_client(inputs.sse_url) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-            res = await session.call_tool("dashboard.generate_option1", arguments=args)
-            payload = _parse_text_response(res)
+    async with open_session(inputs.sse_url) as session:
+        res = await session.call_tool("dashboard.generate_option1", arguments=args)
+        payload = _parse_text_response(res)
 
     files = (payload.get("result") or {}).get("files") or {}
     return files.get("html_path"), files.get("json_path")
 
 
+def _clean_goal_ids(
+    _ctx: click.Context, _param: click.Parameter, value: tuple[str, ...]
+) -> tuple[str, ...]:
+    return tuple(goal_id for goal_id in (raw.strip() for raw in value) if goal_id)
+
+
 @click.command()
-@click.option("--sse-url", default=DEFAULT_SSE_URL, show_default=True)
+@click.option(
+    "--sse-url",
+    default=DEFAULT_SSE_URL,
+    show_default=True,
+    help="Server URL; a URL ending in /mcp uses streamable HTTP instead of SSE.",
+)
 @click.option("--account-id", default=None)
 @click.option("--direct-client-login", default=None)
 @click.option("--counter-id", default=None)
-@click.option("--goal-id", "goal_ids", multiple=True, help="Metrica goal id (repeatable).")
+@click.option(
+    "--goal-id",
+    "goal_ids",
+    multiple=True,
+    type=click.STRING,
+    callback=_clean_goal_ids,
+    help="Metrica goal id (repeatable).",
+)
 @click.option("--date-from", required=True, help="YYYY-MM-DD (current period).")
 @click.option("--date-to", required=True, help="YYYY-MM-DD (current period).")
 @click.option("--output-dir", required=True, type=click.Path(path_type=Path))
@@ -95,6 +116,8 @@ def main(
     include_raw_reports: bool,
 ) -> None:
     """Generate dashboard HTML+JSON into OUTPUT_DIR."""
+    import anyio
+
     html_path, json_path = anyio.run(
         _run,
         Inputs(
@@ -102,7 +125,7 @@ def main(
             account_id=account_id,
             direct_client_login=direct_client_login,
             counter_id=counter_id,
-            goal_ids=[str(x).strip() for x in goal_ids if str(x).strip()],
+            goal_ids=goal_ids,
             date_from=date_from,
             date_to=date_to,
             output_dir=output_dir,
@@ -6,7 +6,7 @@ consistent UTM tags quickly.
 The script:
 1) Lists ads in the campaign (Id, CampaignId, AdGroupId, TextAd.Href)
 2) Builds a new URL by applying a template (placeholders supported)
-3) Updates ads via `direct.update_ads`
+3) Updates ads via `direct.update_ads` (batches of 1000, sent concurrently)
 
 Placeholders in the template string:
 - {campaign_id}
@@ -21,27 +21,46 @@ from __future__ import annotations
 
 import argparse
 import json
+from typing import TYPE_CHECKING
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-import anyio
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+from _mcp_session import open_session, update_ads_in_batches
+
+if TYPE_CHECKING:
+    from mcp.client.session import ClientSession
 
 
 SSE_URL = "http://localhost:8000/sse"
 
 
 def _parse(res) -> dict:
-    return json.loads(res.content[0].text)
+    return getattr(res, "structuredContent", None) or _loads(res.content[0].text)
+
+
+def _to_int(value) -> int:
+    # Ids normally arrive as ints; only coerce when the server sent a string.
+    return value if value.__class__ is int else int(value)
 
 
 def _merge_query(url: str, params: dict[str, str], *, overwrite: bool) -> str:
+    if not params:
+        return url
+    if "?" not in url and "#" not in url:
+        # Nothing to merge with: skip the urlparse/urlunparse round-trip.
+        return f"{url}?{urlencode(params, doseq=True)}"
     parsed = urlparse(url)
     query = dict(parse_qsl(parsed.query, keep_blank_values=True))
-    for k, v in params.items():
-        if overwrite or k not in query:
-            query[k] = v
+    if overwrite:
+        query.update(params)
+    else:
+        for k, v in params.items():
+            if k not in query:
+                query[k] = v
     new_query = urlencode(query, doseq=True)
     return urlunparse(parsed._replace(query=new_query))
 
@@ -52,57 +71,72 @@ def _parse_utm_kv(utm: str) -> dict[str, str]:
     return dict(parse_qsl(q, keep_blank_values=True))
 
 
+def _compile_utm_template(utm_template: str) -> list[tuple[str, str, bool]]:
+    """Parse the template once; flag pairs that contain placeholders."""
+    return [
+        (k, v, "{" in k or "}" in k or "{" in v or "}" in v)
+        for k, v in _parse_utm_kv(utm_template).items()
+    ]
+
+
+def _render_utm(template: list[tuple[str, str, bool]], fields: dict[str, object]) -> dict[str, str]:
+    return {
+        (k.format_map(fields) if dynamic else k): (v.format_map(fields) if dynamic else v)
+        for k, v, dynamic in template
+    }
+
+
 async def main(campaign_id: int, utm_template: str, overwrite: bool) -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-
-            res = await session.call_tool(
-                "direct.list_ads",
-                arguments={
-                    "params": {
-                        "SelectionCriteria": {"CampaignIds": [campaign_id]},
-                        "FieldNames": ["Id", "CampaignId", "AdGroupId", "Type", "Subtype"],
-                        "TextAdFieldNames": ["Href"],
-                    }
-                },
+    async with open_session(SSE_URL) as session:
+        res = await session.call_tool(
+            "direct.list_ads",
+            arguments={
+                "params": {
+                    "SelectionCriteria": {"CampaignIds": [campaign_id]},
+                    "FieldNames": ["Id", "CampaignId", "AdGroupId", "Type", "Subtype"],
+                    "TextAdFieldNames": ["Href"],
+                }
+            },
+        )
+        data = _parse(res)
+        ads = data.get("result", {}).get("Ads", [])
+
+        template = _compile_utm_template(utm_template)
+        # One filter pass extracts just the columns the rewrite needs.
+        text_ads = [
+            (_to_int(ad["Id"]), ad.get("CampaignId"), ad.get("AdGroupId"), href)
+            for ad in ads
+            if isinstance(ad, dict)
+            and "Id" in ad
+            and ad.get("Type") == "TEXT_AD"
+            and isinstance(text_ad := ad.get("TextAd"), dict)
+            and isinstance(href := text_ad.get("Href"), str)
+            and href
+        ]
+
+        updates = []
+        changed = 0
+        for ad_id, ad_campaign_id, adgroup_id, href in text_ads:
+            kv = _render_utm(
+                template,
+                {"campaign_id": ad_campaign_id, "adgroup_id": adgroup_id, "ad_id": ad_id},
             )
-            data = _parse(res)
-            ads = data.get("result", {}).get("Ads", [])
-
-            updates = []
-            changed = 0
-            for ad in ads:
-                if not isinstance(ad, dict) or "Id" not in ad:
-                    continue
-                if ad.get("Type") != "TEXT_AD":
-                    continue
-                text_ad = ad.get("TextAd")
-                if not isinstance(text_ad, dict):
-                    continue
-                href = text_ad.get("Href")
-                if not isinstance(href, str) or not href:
-                    continue
-
-                rendered = utm_template.format(
-                    campaign_id=ad.get("CampaignId"),
-                    adgroup_id=ad.get("AdGroupId"),
-                    ad_id=ad.get("Id"),
-                )
-                kv = _parse_utm_kv(rendered)
-                new_href = _merge_query(href, kv, overwrite=overwrite)
-                if new_href == href:
-                    continue
-
-                updates.append({"Id": int(ad["Id"]), "TextAd": {"Href": new_href}})
-                changed += 1
-
-            if not updates:
-                print(json.dumps({"campaign_id": campaign_id, "changed_ads": 0}, ensure_ascii=True))
-                return
-
-            upd = await session.call_tool("direct.update_ads", arguments={"items": updates})
-            print(json.dumps({"campaign_id": campaign_id, "changed_ads": changed, "result": _parse(upd)}, ensure_ascii=True))
+            new_href = _merge_query(href, kv, overwrite=overwrite)
+            if new_href == href:
+                continue
+
+            updates.append({"Id": ad_id, "TextAd": {"Href": new_href}})
+            changed += 1
+
+        if not updates:
+            print(json.dumps({"campaign_id": campaign_id, "changed_ads": 0}, ensure_ascii=True))
+            return
+
+        batches = await update_ads_in_batches(session, updates)
+        results = [_parse(upd) for upd in batches]
+        # `result` stays a single payload for one batch; several batches give a list.
+        result = results[0] if len(results) == 1 else results
+        print(json.dumps({"campaign_id": campaign_id, "changed_ads": changed, "result": result}, ensure_ascii=True))
 
 
 if __name__ == "__main__":
@@ -111,5 +145,8 @@ if __name__ == "__main__":
     parser.add_argument("--utm", type=str, required=True, help="UTM template string (querystring).")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing UTM keys if present.")
     args = parser.parse_args()
+
+    import anyio
+
     anyio.run(main, args.campaign_id, args.utm, args.overwrite)
 
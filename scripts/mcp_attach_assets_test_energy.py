@@ -15,11 +15,19 @@ Requirements:
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING
 
 import anyio
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import open_session, update_ads_in_batches
+
+if TYPE_CHECKING:
+    from mcp.client.session import ClientSession
 
 
 SSE_URL = "http://localhost:8000/sse"
@@ -37,7 +45,7 @@ CALLOUT_TEXTS = [
 
 
 def _parse(res) -> dict:
-    return json.loads(res.content[0].text)
+    return getattr(res, "structuredContent", None) or _loads(res.content[0].text)
 
 
 async def _find_campaign_id(session: ClientSession) -> int:
@@ -126,25 +134,21 @@ async def _get_existing_callouts_by_text(session: ClientSession) -> dict[str, in
     if "error" in data:
         return {}
     extensions = data.get("result", {}).get("AdExtensions", [])
-    result: dict[str, int] = {}
-    for ext in extensions:
-        if not isinstance(ext, dict):
-            continue
-        if ext.get("Type") != "CALLOUT":
-            continue
-        callout = ext.get("Callout")
-        if not isinstance(callout, dict):
-            continue
-        text = callout.get("CalloutText")
-        if isinstance(text, str) and "Id" in ext:
-            result[text] = int(ext["Id"])
-    return result
+    # The request already filters Types=[CALLOUT], so no per-item Type check.
+    return {
+        callout["CalloutText"]: int(ext["Id"])
+        for ext in extensions
+        if isinstance(ext, dict)
+        and "Id" in ext
+        and isinstance(callout := ext.get("Callout"), dict)
+        and isinstance(callout.get("CalloutText"), str)
+    }
 
 
 async def _ensure_callouts(session: ClientSession) -> list[int]:
     existing = await _get_existing_callouts_by_text(session)
     missing = [text for text in CALLOUT_TEXTS if text not in existing]
-    created_ids: list[int] = []
+    created: dict[str, int] = {}
 
     if missing:
         res = await session.call_tool(
@@ -157,16 +161,16 @@ async def _ensure_callouts(session: ClientSession) -> list[int]:
         )
         data = _parse(res)
         results = data.get("result", {}).get("AddResults", [])
-        for r in results:
-            if isinstance(r, dict) and "Id" in r:
-                created_ids.append(int(r["Id"]))
+        # AddResults follow request order; failed items carry Errors instead of Id.
+        created = {
+            text: int(r["Id"]) for text, r in zip(missing, results) if isinstance(r, dict) and "Id" in r
+        }
 
-    ids: list[int] = []
-    for text in CALLOUT_TEXTS:
-        if text in existing:
-            ids.append(existing[text])
-    ids.extend(created_ids)
-    return ids[: len(CALLOUT_TEXTS)]
+    return [
+        callout_id
+        for text in CALLOUT_TEXTS
+        if (callout_id := existing.get(text) or created.get(text)) is not None
+    ]
 
 
 def _extract_common_sitelink_set_id(ads: list[dict]) -> int | None:
@@ -187,53 +191,61 @@ def _extract_common_sitelink_set_id(ads: list[dict]) -> int | None:
     return None
 
 
+def _to_int(value) -> int:
+    # Ids normally arrive as ints; only coerce when the server sent a string.
+    return value if value.__class__ is int else int(value)
+
+
 async def _update_ads(
     session: ClientSession,
     ads: list[dict],
     sitelink_set_id: int,
     callout_ids: list[int],
 ) -> list[int]:
-    items = []
-    updated: list[int] = []
-    for ad in ads:
-        ad_id = int(ad["Id"])
-        text_ad: dict = {"SitelinkSetId": sitelink_set_id}
-        if callout_ids:
-            text_ad["AdExtensions"] = {"AdExtensionIds": callout_ids}
-        items.append({"Id": ad_id, "TextAd": text_ad})
-        updated.append(ad_id)
-    await session.call_tool("direct.update_ads", arguments={"items": items})
-    return updated
+    ext_block = {"AdExtensions": {"AdExtensionIds": callout_ids}} if callout_ids else {}
+    items = [
+        {"Id": _to_int(ad["Id"]), "TextAd": {"SitelinkSetId": sitelink_set_id, **ext_block}}
+        for ad in ads
+    ]
+    await update_ads_in_batches(session, items)
+    return [item["Id"] for item in items]
 
 
 async def main() -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-
-            campaign_id = await _find_campaign_id(session)
-            adgroup_id = await _find_adgroup_id(session, campaign_id)
+    async with open_session(SSE_URL) as session:
+        campaign_id = await _find_campaign_id(session)
+        adgroup_id = await _find_adgroup_id(session, campaign_id)
+        callout_ids: list[int] = []
+
+        async def _collect_callouts() -> None:
+            callout_ids.extend(await _ensure_callouts(session))
+
+        # Callouts do not depend on the ads/sitelinks, so overlap their round-trips.
+        # The task group cancels and awaits the callouts task if anything below fails.
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_collect_callouts)
             ads = await _list_ads_for_update(session, adgroup_id)
-            if not ads:
-                raise RuntimeError("No ads found to update; run scripts/mcp_seed_test_energy.py first.")
-
-            sitelink_set_id = _extract_common_sitelink_set_id(ads) or await _create_sitelinks_set(session)
-            callout_ids = await _ensure_callouts(session)
-
-            updated_ads = await _update_ads(session, ads, sitelink_set_id, callout_ids)
-
-            print(
-                json.dumps(
-                    {
-                        "campaign_id": campaign_id,
-                        "adgroup_id": adgroup_id,
-                        "updated_ads": updated_ads,
-                        "sitelink_set_id": sitelink_set_id,
-                        "callout_ids": callout_ids,
-                    },
-                    ensure_ascii=True,
-                )
+            if ads:
+                sitelink_set_id = _extract_common_sitelink_set_id(ads) or await _create_sitelinks_set(session)
+            else:
+                tg.cancel_scope.cancel()
+        if not ads:
+            raise RuntimeError("No ads found to update; run scripts/mcp_seed_test_energy.py first.")
+
+        updated_ads = await _update_ads(session, ads, sitelink_set_id, callout_ids)
+
+        print(
+            json.dumps(
+                {
+                    "campaign_id": campaign_id,
+                    "adgroup_id": adgroup_id,
+                    "updated_ads": updated_ads,
+                    "sitelink_set_id": sitelink_set_id,
+                    "callout_ids": callout_ids,
+                },
+                ensure_ascii=True,
             )
+        )
 
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ This script is best-effort idempotent:
 - It does not create duplicate ad groups (by Name).
 - It does not create duplicate keywords (by Keyword).
 - It tries to avoid duplicate ads (by Title+Href).
+- It remembers the resolved campaign/ad group ids under `~/.cache/` and, after
+  one check that the ad group still exists, skips the listing calls next run.
 
 Requirements:
 - MCP server running with SSE transport (default `docker compose up -d --build`)
@@ -18,16 +20,35 @@ Requirements:
 
 from __future__ import annotations
 
+import hashlib
 import json
+from pathlib import Path
 
 import anyio
 
 from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import list_all, open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
 
+REQUIRED_TOOLS = {
+    "direct.list_campaigns",
+    "direct.create_campaigns",
+    "direct.list_adgroups",
+    "direct.create_adgroups",
+    "direct.list_ads",
+    "direct.create_ads",
+    "direct.list_keywords",
+    "direct.create_keywords",
+}
+
 CAMPAIGN_NAME = "MCP test-energy.ru"
 ADGROUP_NAME = "MCP test-energy.ru / RU+Moscow"
 
@@ -44,6 +65,9 @@ KEYWORDS = [
     "оборудование для лэп",
 ]
 
+# Phrase-match form of KEYWORDS, as stored by Direct.
+KEYWORD_PHRASES = tuple(f"\"{keyword}\"" for keyword in KEYWORDS)
+
 ADS = [
     {
         "Title": "Электротехника и комплектующие",
@@ -63,8 +87,35 @@ ADS = [
 ]
 
 
+# Last resolved {campaign_id, adgroup_id} for this server + structure names.
+SEED_CACHE_PATH = Path("~/.cache/yandex-direct-metrica-mcp") / (
+    "seed-"
+    + hashlib.sha256(f"{SSE_URL}|{CAMPAIGN_NAME}|{ADGROUP_NAME}".encode("utf-8")).hexdigest()[:16]
+    + ".json"
+)
+
+
+def _load_seed_cache() -> tuple[int, int] | None:
+    try:
+        data = json.loads(SEED_CACHE_PATH.expanduser().read_text(encoding="utf-8"))
+        return int(data["campaign_id"]), int(data["adgroup_id"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_seed_cache(campaign_id: int, adgroup_id: int) -> None:
+    path = SEED_CACHE_PATH.expanduser()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"campaign_id": campaign_id, "adgroup_id": adgroup_id}), encoding="utf-8"
+        )
+    except OSError:
+        pass  # best effort; the next run just resolves the ids again
+
+
 def _parse_text_response(res) -> dict:
-    return json.loads(res.content[0].text)
+    return getattr(res, "structuredContent", None) or _loads(res.content[0].text)
 
 
 async def _get_or_create_campaign(session: ClientSession) -> int:
@@ -133,22 +184,24 @@ async def _get_or_create_adgroup(session: ClientSession, campaign_id: int) -> in
 
 
 async def _ensure_keywords(session: ClientSession, adgroup_id: int) -> None:
-    res = await session.call_tool(
+    existing = await list_all(
+        session,
         "direct.list_keywords",
-        arguments={
-            "selection_criteria": {"AdGroupIds": [adgroup_id]},
-            "field_names": ["Id", "Keyword"],
-        },
+        {"selection_criteria": {"AdGroupIds": [adgroup_id]}, "field_names": ["Id", "Keyword"]},
+        "Keywords",
     )
-    existing = _parse_text_response(res).get("result", {}).get("Keywords", [])
-    existing_keywords = {kw.get("Keyword") for kw in existing if isinstance(kw, dict)}
-
-    to_add = []
-    for keyword in KEYWORDS:
-        phrase = f"\"{keyword}\""
-        if phrase in existing_keywords:
+    existing_keywords: set[str] = set()
+    for kw in existing:
+        try:
+            existing_keywords.add(kw["Keyword"])
+        except (KeyError, TypeError):
             continue
-        to_add.append({"AdGroupId": adgroup_id, "Keyword": phrase})
+
+    to_add = [
+        {"AdGroupId": adgroup_id, "Keyword": phrase}
+        for phrase in KEYWORD_PHRASES
+        if phrase not in existing_keywords
+    ]
 
     if not to_add:
         return
@@ -158,26 +211,25 @@ async def _ensure_keywords(session: ClientSession, adgroup_id: int) -> None:
 
 async def _ensure_ads(session: ClientSession, adgroup_id: int) -> None:
     # Use raw params override to request TextAd details.
-    res = await session.call_tool(
+    existing = await list_all(
+        session,
         "direct.list_ads",
-        arguments={
+        {
             "params": {
                 "SelectionCriteria": {"AdGroupIds": [adgroup_id]},
                 "FieldNames": ["Id", "AdGroupId", "TextAd"],
                 "TextAdFieldNames": ["Title", "Title2", "Text", "Href"],
             }
         },
+        "Ads",
     )
-    existing = _parse_text_response(res).get("result", {}).get("Ads", [])
     existing_keys: set[tuple[str, str]] = set()
     for ad in existing:
-        text_ad = ad.get("TextAd") if isinstance(ad, dict) else None
-        if not isinstance(text_ad, dict):
+        try:
+            text_ad = ad["TextAd"]
+            existing_keys.add((text_ad["Title"], text_ad["Href"]))
+        except (KeyError, TypeError):
             continue
-        title = text_ad.get("Title")
-        href = text_ad.get("Href")
-        if isinstance(title, str) and isinstance(href, str):
-            existing_keys.add((title, href))
 
     to_add = []
     for spec in ADS:
@@ -202,38 +254,47 @@ async def _ensure_ads(session: ClientSession, adgroup_id: int) -> None:
     await session.call_tool("direct.create_ads", arguments={"items": to_add})
 
 
-async def main() -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-
-            required = {
-                "direct.list_campaigns",
-                "direct.create_campaigns",
-                "direct.list_adgroups",
-                "direct.create_adgroups",
-                "direct.list_ads",
-                "direct.create_ads",
-                "direct.list_keywords",
-                "direct.create_keywords",
-            }
-            tools = await session.list_tools()
-            names = {t.name for t in tools.tools}
-            missing = sorted(required - names)
-            if missing:
-                raise RuntimeError(f"Server missing tools: {missing}")
+async def _cached_structure(session: ClientSession) -> tuple[int, int] | None:
+    """Return cached ids if the ad group still exists under the cached campaign."""
+    cached = _load_seed_cache()
+    if cached is None:
+        return None
+    campaign_id, adgroup_id = cached
+    # One targeted lookup replaces the full campaign + ad group listings.
+    res = await session.call_tool(
+        "direct.list_adgroups",
+        arguments={
+            "selection_criteria": {"Ids": [adgroup_id]},
+            "field_names": ["Id", "Name", "CampaignId"],
+        },
+    )
+    groups = _parse_text_response(res).get("result", {}).get("AdGroups", [])
+    for group in groups:
+        if group.get("Name") == ADGROUP_NAME and group.get("CampaignId") == campaign_id:
+            return cached
+    return None
 
+
+async def main() -> None:
+    async with open_session(SSE_URL, required=REQUIRED_TOOLS) as session:
+        cached = await _cached_structure(session)
+        if cached is not None:
+            campaign_id, adgroup_id = cached
+        else:
             campaign_id = await _get_or_create_campaign(session)
             adgroup_id = await _get_or_create_adgroup(session, campaign_id)
-            await _ensure_ads(session, adgroup_id)
-            await _ensure_keywords(session, adgroup_id)
-
-            print(
-                json.dumps(
-                    {"campaign_id": campaign_id, "adgroup_id": adgroup_id},
-                    ensure_ascii=True,
-                )
+            _save_seed_cache(campaign_id, adgroup_id)
+        # Ads and keywords are independent once the ad group exists.
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_ensure_ads, session, adgroup_id)
+            tg.start_soon(_ensure_keywords, session, adgroup_id)
+
+        print(
+            json.dumps(
+                {"campaign_id": campaign_id, "adgroup_id": adgroup_id},
+                ensure_ascii=True,
             )
+        )
 
 
 if __name__ == "__main__":
@@ -12,97 +12,106 @@ Flow:
 from __future__ import annotations
 
 import argparse
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 import json
 
 import anyio
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import list_all, open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
 
 
-def _micros_from_rub(value: float) -> int:
-    return int(round(value * 1_000_000))
+def _rub(text: str) -> Decimal:
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        value = None
+    if value is None or not value.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid ruble amount: {text!r}")
+    return value
+
+
+def _micros_from_rub(value: Decimal) -> int:
+    # Exact decimal arithmetic: "12.37" is 12_370_000, never 12_369_999.
+    return int((value * 1_000_000).to_integral_value(rounding=ROUND_HALF_UP))
 
 
 def _parse(res) -> dict:
-    return getattr(res, "structuredContent", None) or json.loads(res.content[0].text)
+    return getattr(res, "structuredContent", None) or _loads(res.content[0].text)
 
 
-async def main(campaign_id: int, bid_rub: float, apply: bool) -> None:
+async def main(campaign_id: int, bid_rub: Decimal, apply: bool) -> None:
     bid_micros = _micros_from_rub(bid_rub)
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-
-            kw_res = await session.call_tool(
-                "direct.list_keywords",
-                arguments={
-                    "selection_criteria": {"CampaignIds": [campaign_id]},
-                    "field_names": ["Id", "Keyword", "CampaignId", "AdGroupId"],
-                },
-            )
-            kw_data = _parse(kw_res)
-            keywords = kw_data.get("result", {}).get("Keywords", [])
-            auto_ids: list[int] = []
-            for kw in keywords:
-                if not isinstance(kw, dict):
-                    continue
-                if kw.get("Keyword") != "---autotargeting":
-                    continue
-                if "Id" in kw:
+    async with open_session(SSE_URL) as session:
+        keywords = await list_all(
+            session,
+            "direct.list_keywords",
+            {
+                "selection_criteria": {"CampaignIds": [campaign_id]},
+                # Only the fields the filter reads; the API skips the rest.
+                "field_names": ["Id", "Keyword"],
+            },
+            "Keywords",
+        )
+        auto_ids: list[int] = []
+        for kw in keywords:
+            try:
+                if kw["Keyword"] == "---autotargeting":
                     auto_ids.append(int(kw["Id"]))
+            except (KeyError, TypeError):
+                continue
 
-            if not auto_ids:
-                raise RuntimeError("No ---autotargeting keywords found in this campaign.")
+        if not auto_ids:
+            raise RuntimeError("No ---autotargeting keywords found in this campaign.")
 
-            preview = {
-                "tool": "direct.raw_call",
-                "arguments": {
-                    "resource": "bids",
-                    "method": "set",
-                    "params": {"Bids": [{"KeywordId": kid, "Bid": bid_micros} for kid in auto_ids]},
-                },
-            }
-
-            if not apply:
-                print(
-                    json.dumps(
-                        {
-                            "status": "dry_run",
-                            "campaign_id": campaign_id,
-                            "autotargeting_keyword_ids": auto_ids,
-                            "bid_micros": bid_micros,
-                            "preview": preview,
-                            "hint": "Re-run with --apply to execute.",
-                        },
-                        ensure_ascii=True,
-                    )
-                )
-                return
+        arguments = {
+            "resource": "bids",
+            "method": "set",
+            "params": {"Bids": [{"KeywordId": kid, "Bid": bid_micros} for kid in auto_ids]},
+        }
 
-            res = await session.call_tool("direct.raw_call", arguments=preview["arguments"])
+        if not apply:
             print(
                 json.dumps(
                     {
-                        "status": "ok",
+                        "status": "dry_run",
                         "campaign_id": campaign_id,
                         "autotargeting_keyword_ids": auto_ids,
                         "bid_micros": bid_micros,
-                        "preview": preview,
-                        "result": _parse(res),
+                        "preview": {"tool": "direct.raw_call", "arguments": arguments},
+                        "hint": "Re-run with --apply to execute.",
                     },
                     ensure_ascii=True,
                 )
             )
+            return
+
+        res = await session.call_tool("direct.raw_call", arguments=arguments)
+        print(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "campaign_id": campaign_id,
+                    "autotargeting_keyword_ids": auto_ids,
+                    "bid_micros": bid_micros,
+                    "result": _parse(res),
+                },
+                ensure_ascii=True,
+            )
+        )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--campaign-id", type=int, required=True)
-    parser.add_argument("--bid-rub", type=float, required=True)
+    parser.add_argument("--bid-rub", type=_rub, required=True)
     parser.add_argument("--apply", action="store_true", help="Execute the change (default: dry-run).")
     args = parser.parse_args()
     anyio.run(main, args.campaign_id, args.bid_rub, args.apply)
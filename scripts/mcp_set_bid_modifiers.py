@@ -20,8 +20,12 @@ from pathlib import Path
 
 import anyio
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
@@ -35,40 +39,35 @@ def _load_json(value: str) -> dict:
 
 
 async def main(method: str, payload: dict, apply: bool) -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-            preview = {
-                "tool": "direct.raw_call",
-                "arguments": {"resource": "bidmodifiers", "method": method, "params": payload},
-            }
-
-            write_methods = {"add", "set", "delete", "update"}
-            is_write = method.strip().lower() in write_methods
-            if is_write and not apply:
-                print(
-                    json.dumps(
-                        {
-                            "status": "dry_run",
-                            "preview": preview,
-                            "hint": "Re-run with --apply to execute.",
-                        },
-                        ensure_ascii=True,
-                    )
-                )
-                return
+    async with open_session(SSE_URL) as session:
+        arguments = {"resource": "bidmodifiers", "method": method, "params": payload}
 
-            res = await session.call_tool("direct.raw_call", arguments=preview["arguments"])
+        write_methods = {"add", "set", "delete", "update"}
+        is_write = method.strip().lower() in write_methods
+        if is_write and not apply:
             print(
                 json.dumps(
                     {
-                        "status": "ok",
-                        "preview": preview,
-                        "result": getattr(res, "structuredContent", None) or json.loads(res.content[0].text),
+                        "status": "dry_run",
+                        "preview": {"tool": "direct.raw_call", "arguments": arguments},
+                        "hint": "Re-run with --apply to execute.",
                     },
                     ensure_ascii=True,
                 )
             )
+            return
+
+        res = await session.call_tool("direct.raw_call", arguments=arguments)
+        print(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "method": method,
+                    "result": getattr(res, "structuredContent", None) or _loads(res.content[0].text),
+                },
+                ensure_ascii=True,
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -12,109 +12,121 @@ Notes:
 from __future__ import annotations
 
 import argparse
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 import json
+from typing import Iterable
 
 import anyio
 
 from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import list_all, open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
 
 
 def _parse(res) -> dict:
-    return getattr(res, "structuredContent", None) or json.loads(res.content[0].text)
+    return getattr(res, "structuredContent", None) or _loads(res.content[0].text)
+
 
+def _rub(text: str) -> Decimal:
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        value = None
+    if value is None or not value.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid ruble amount: {text!r}")
+    return value
 
-def _micros_from_rub(value: float) -> int:
-    return int(round(value * 1_000_000))
+
+def _micros_from_rub(value: Decimal) -> int:
+    # Exact decimal arithmetic: "12.37" is 12_370_000, never 12_369_999.
+    return int((value * 1_000_000).to_integral_value(rounding=ROUND_HALF_UP))
 
 
 async def _collect_keyword_ids(session: ClientSession, campaign_id: int) -> list[int]:
-    res = await session.call_tool(
+    keywords = await list_all(
+        session,
         "direct.list_keywords",
-        arguments={
-            "selection_criteria": {"CampaignIds": [campaign_id]},
-            "field_names": ["Id", "Keyword"],
-        },
+        {"selection_criteria": {"CampaignIds": [campaign_id]}, "field_names": ["Id", "Keyword"]},
+        "Keywords",
     )
-    data = _parse(res)
-    keywords = data.get("result", {}).get("Keywords", [])
     ids: list[int] = []
     for kw in keywords:
-        if not isinstance(kw, dict):
+        # Rows are JSON objects; a malformed row only costs the except path.
+        try:
+            text = kw["Keyword"]
+            kid = kw["Id"]
+        except (KeyError, TypeError):
             continue
-        text = kw.get("Keyword")
-        if isinstance(text, str) and text.startswith("---"):
+        if text.startswith("---"):
             continue
-        if "Id" in kw:
-            ids.append(int(kw["Id"]))
+        ids.append(int(kid))
     return ids
 
 
-async def _set_bids(session: ClientSession, keyword_ids: list[int], bid_micros: int) -> dict:
-    payload = {
+def _bids_payload(bids: Iterable[tuple[int, int]]) -> dict:
+    """`bids.set` payload from (keyword_id, bid_micros) pairs."""
+    return {
         "resource": "bids",
         "method": "set",
-        "params": {"Bids": [{"KeywordId": kid, "Bid": bid_micros} for kid in keyword_ids]},
+        "params": {"Bids": [{"KeywordId": kid, "Bid": micros} for kid, micros in bids]},
     }
+
+
+async def _set_bids(session: ClientSession, payload: dict) -> dict:
     res = await session.call_tool("direct.raw_call", arguments=payload)
     return _parse(res)
 
 
-async def main(campaign_id: int, bid_rub: float, apply: bool) -> None:
+async def main(campaign_id: int, bid_rub: Decimal, apply: bool) -> None:
     bid_micros = _micros_from_rub(bid_rub)
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-            ids = await _collect_keyword_ids(session, campaign_id)
-            if not ids:
-                raise RuntimeError("No keywords found to update bids for.")
-            preview = {
-                "tool": "direct.raw_call",
-                "arguments": {
-                    "resource": "bids",
-                    "method": "set",
-                    "params": {"Bids": [{"KeywordId": kid, "Bid": bid_micros} for kid in ids]},
-                },
-            }
-            if not apply:
-                print(
-                    json.dumps(
-                        {
-                            "status": "dry_run",
-                            "campaign_id": campaign_id,
-                            "keyword_count": len(ids),
-                            "bid_micros": bid_micros,
-                            "preview": preview,
-                            "hint": "Re-run with --apply to execute.",
-                        },
-                        ensure_ascii=True,
-                    )
-                )
-                return
-
-            result = await _set_bids(session, ids, bid_micros)
+    async with open_session(SSE_URL) as session:
+        ids = await _collect_keyword_ids(session, campaign_id)
+        if not ids:
+            raise RuntimeError("No keywords found to update bids for.")
+        payload = _bids_payload((kid, bid_micros) for kid in ids)
+        if not apply:
             print(
                 json.dumps(
                     {
-                        "status": "ok",
+                        "status": "dry_run",
                         "campaign_id": campaign_id,
                         "keyword_count": len(ids),
                         "bid_micros": bid_micros,
-                        "preview": preview,
-                        "result": result,
+                        "preview": {"tool": "direct.raw_call", "arguments": payload},
+                        "hint": "Re-run with --apply to execute.",
                     },
                     ensure_ascii=True,
                 )
             )
+            return
+
+        result = await _set_bids(session, payload)
+        print(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "campaign_id": campaign_id,
+                    "keyword_count": len(ids),
+                    "bid_micros": bid_micros,
+                    "result": result,
+                },
+                ensure_ascii=True,
+            )
+        )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--campaign-id", type=int, required=True)
-    parser.add_argument("--bid-rub", type=float, required=True, help="Bid in rubles (converted to micros).")
+    parser.add_argument("--bid-rub", type=_rub, required=True, help="Bid in rubles (converted to micros).")
     parser.add_argument("--apply", action="store_true", help="Execute the change (default: dry-run).")
     args = parser.parse_args()
     anyio.run(main, args.campaign_id, args.bid_rub, args.apply)
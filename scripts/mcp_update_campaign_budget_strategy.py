@@ -25,8 +25,12 @@ from pathlib import Path
 
 import anyio
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
@@ -40,26 +44,24 @@ def _load_json(value: str) -> dict:
 
 
 async def main(campaign_id: int, patch: dict, apply: bool) -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-            item = {"Id": campaign_id, **patch}
-            preview = {"tool": "direct.update_campaigns", "arguments": {"items": [item]}}
-            if not apply:
-                print(
-                    json.dumps(
-                        {
-                            "status": "dry_run",
-                            "preview": preview,
-                            "hint": "Re-run with --apply to execute.",
-                        },
-                        ensure_ascii=True,
-                    )
+    async with open_session(SSE_URL) as session:
+        arguments = {"items": [{"Id": campaign_id, **patch}]}
+        if not apply:
+            preview = {"tool": "direct.update_campaigns", "arguments": arguments}
+            print(
+                json.dumps(
+                    {
+                        "status": "dry_run",
+                        "preview": preview,
+                        "hint": "Re-run with --apply to execute.",
+                    },
+                    ensure_ascii=True,
                 )
-                return
-            res = await session.call_tool("direct.update_campaigns", arguments=preview["arguments"])
-            result = getattr(res, "structuredContent", None) or json.loads(res.content[0].text)
-            print(json.dumps({"status": "ok", "preview": preview, "result": result}, ensure_ascii=True))
+            )
+            return
+        res = await session.call_tool("direct.update_campaigns", arguments=arguments)
+        result = getattr(res, "structuredContent", None) or _loads(res.content[0].text)
+        print(json.dumps({"status": "ok", "campaign_id": campaign_id, "result": result}, ensure_ascii=True))
 
 
 if __name__ == "__main__":
@@ -8,46 +8,61 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 
 import anyio
 
-from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
+
+from _mcp_session import open_session
 
 
 SSE_URL = "http://localhost:8000/sse"
 
 
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
 def _split_csv(value: str) -> list[str]:
-    return [v.strip() for v in value.split(",") if v.strip()]
+    # The separator pattern eats surrounding whitespace, so tokens need no strip().
+    return [v for v in _CSV_RE.split(value.strip()) if v]
 
 
 async def main(campaign_id: int, negatives: list[str], apply: bool) -> None:
-    async with sse_client(SSE_URL) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
-            await session.initialize()
-            preview = {
-                "tool": "direct.update_campaigns",
-                "arguments": {
-                    "items": [
-                        {
-                            "Id": campaign_id,
-                            "NegativeKeywords": {"Items": negatives},
-                        }
-                    ]
-                },
-            }
-            if not apply:
-                print(
-                    json.dumps(
-                        {"status": "dry_run", "preview": preview, "hint": "Re-run with --apply to execute."},
-                        ensure_ascii=True,
-                    )
+    async with open_session(SSE_URL) as session:
+        arguments = {
+            "items": [
+                {
+                    "Id": campaign_id,
+                    "NegativeKeywords": {"Items": negatives},
+                }
+            ]
+        }
+        if not apply:
+            preview = {"tool": "direct.update_campaigns", "arguments": arguments}
+            print(
+                json.dumps(
+                    {"status": "dry_run", "preview": preview, "hint": "Re-run with --apply to execute."},
+                    ensure_ascii=True,
                 )
-                return
-            res = await session.call_tool("direct.update_campaigns", arguments=preview["arguments"])
-            result = getattr(res, "structuredContent", None) or json.loads(res.content[0].text)
-            print(json.dumps({"status": "ok", "preview": preview, "result": result}, ensure_ascii=True))
+            )
+            return
+        res = await session.call_tool("direct.update_campaigns", arguments=arguments)
+        result = getattr(res, "structuredContent", None) or _loads(res.content[0].text)
+        print(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "campaign_id": campaign_id,
+                    "negatives_count": len(negatives),
+                    "result": result,
+                },
+                ensure_ascii=True,
+            )
+        )
 
 
 if __name__ == "__main__":
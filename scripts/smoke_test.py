@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime as dt
 import json
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
@@ -16,12 +15,12 @@ if str(SRC) not in sys.path:
 
 from mcp_yandex_ad.auth import TokenManager
 from mcp_yandex_ad.clients import build_clients
-from mcp_yandex_ad.config import load_config
+from mcp_yandex_ad.config import load_config, load_dotenv_once
 from mcp_yandex_ad.errors import normalize_error
 
 
 def main() -> int:
-    load_dotenv()
+    load_dotenv_once()
     config = load_config()
     tokens = TokenManager(config)
     access_token = tokens.get_access_token()
@@ -31,37 +30,47 @@ def main() -> int:
         return 1
 
     clients = build_clients(config, access_token)
+    counter_id = config.metrica_counter_ids[0] if config.metrica_counter_ids else None
 
-    if clients.direct is not None:
+    def probe_direct() -> str:
+        if clients.direct is None:
+            return "Direct client not configured."
         try:
             campaigns = clients.direct.campaigns().post(
                 data={
                     "method": "get",
                     "params": {
                         "SelectionCriteria": {},
-                        "FieldNames": ["Id", "Name"],
+                        "FieldNames": ["Id"],
+                        # Counts come from the totals below; one item proves access.
+                        "Page": {"Limit": 1},
                     },
                 }
             )
-            count = len(campaigns.data.get("result", {}).get("Campaigns", []))
-            print(f"Direct campaigns OK: {count}")
+            result = campaigns.data.get("result", {})
+            count = result.get("TotalNumberOfItems")
+            if count is None:
+                count = len(result.get("Campaigns", []))
+                if result.get("LimitedBy") is not None:
+                    count = f"{count}+"
+            return f"Direct campaigns OK: {count}"
         except Exception as exc:  # pragma: no cover - runtime safety
-            print(json.dumps(normalize_error("direct.campaigns.get", exc), ensure_ascii=False))
-    else:
-        print("Direct client not configured.")
+            return json.dumps(normalize_error("direct.campaigns.get", exc), ensure_ascii=False)
 
-    if clients.metrica_management is not None:
+    def probe_counters() -> str:
+        if clients.metrica_management is None:
+            return "Metrica management client not configured."
         try:
-            counters = clients.metrica_management.counters().get()
-            count = len(counters.data.get("counters", []))
-            print(f"Metrica counters OK: {count}")
+            counters = clients.metrica_management.counters().get(params={"per_page": 1})
+            data = counters.data
+            count = data.get("rows", len(data.get("counters", [])))
+            return f"Metrica counters OK: {count}"
         except Exception as exc:  # pragma: no cover - runtime safety
-            print(json.dumps(normalize_error("metrica.counters.get", exc), ensure_ascii=False))
-    else:
-        print("Metrica management client not configured.")
+            return json.dumps(normalize_error("metrica.counters.get", exc), ensure_ascii=False)
 
-    counter_id = config.metrica_counter_ids[0] if config.metrica_counter_ids else None
-    if clients.metrica_stats is not None and counter_id:
+    def probe_stats() -> str:
+        if clients.metrica_stats is None or not counter_id:
+            return "Metrica stats client not configured or counter ID missing."
         try:
             date_to = dt.date.today()
             date_from = date_to - dt.timedelta(days=7)
@@ -73,14 +82,22 @@ def main() -> int:
                     "date1": str(date_from),
                     "date2": str(date_to),
                     "sort": "ym:s:date",
+                    "limit": 1,
                 }
             )
-            rows = len(report.data.get("data", []))
-            print(f"Metrica report OK: {rows} rows")
+            data = report.data
+            rows = data.get("total_rows", len(data.get("data", [])))
+            return f"Metrica report OK: {rows} rows"
         except Exception as exc:  # pragma: no cover - runtime safety
-            print(json.dumps(normalize_error("metrica.stats.get", exc), ensure_ascii=False))
-    else:
-        print("Metrica stats client not configured or counter ID missing.")
+            return json.dumps(normalize_error("metrica.stats.get", exc), ensure_ascii=False)
+
+    # The probes are independent HTTPS calls: run them side by side, but print
+    # in a fixed order so the output stays comparable between runs.
+    probes = (probe_direct, probe_counters, probe_stats)
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = [pool.submit(probe) for probe in probes]
+        for future in futures:
+            print(future.result())
 
     return 0
 
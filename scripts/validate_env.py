@@ -6,18 +6,16 @@ import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from mcp_yandex_ad.config import load_config
+from mcp_yandex_ad.config import load_config, load_dotenv_once
 
 
 def main() -> int:
-    load_dotenv()
+    load_dotenv_once()
     config = load_config()
     errors: list[str] = []
     warnings: list[str] = []
@@ -1,13 +1,9 @@
 """MCP server for Yandex Direct + Metrica (Python)."""
 
-import asyncio
 import logging
 import os
-import textwrap
-import webbrowser
 
 import click
-from dotenv import load_dotenv
 
 __version__ = "0.1.0"
 
@@ -57,15 +53,17 @@ def main(
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    from .config import load_dotenv_once
+
     if env_file:
         logger.debug("Loading environment from file: %s", env_file)
-        load_dotenv(env_file)
-    else:
-        load_dotenv()
+    load_dotenv_once(env_file)
 
     from . import server
 
     if ctx.invoked_subcommand is None:
+        import asyncio
+
         asyncio.run(server.run_server(transport=transport, port=port))
 
 
@@ -116,6 +114,8 @@ def auth_command(
     click.echo("1) Open this URL and authorize the app:")
     click.echo(auth_url)
     if open_browser:
+        import webbrowser
+
         webbrowser.open(auth_url)
 
     click.echo("\n2) Paste the authorization code from Yandex:")
@@ -134,6 +134,8 @@ def auth_command(
     except Exception as exc:
         raise click.ClickException(str(exc)) from exc
 
+    import textwrap
+
     click.echo("\n✓ Success. Add these to your `.env` (do not commit it):\n")
     refresh = tokens.refresh_token or ""
     click.echo(
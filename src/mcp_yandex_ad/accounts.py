@@ -10,13 +10,30 @@ It intentionally does NOT store OAuth tokens or other secrets.
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    from json import loads as _loads
 
 logger = logging.getLogger("yandex-direct-metrica-mcp")
 
+_LOGIN_KEYS = ("direct_client_login", "directClientLogin")
+_COUNTER_KEYS = ("metrica_counter_ids", "metricaCounterIds", "metrica_counters")
+
+
+def clean_str_list(items: Iterable[Any]) -> list[str]:
+    """Stringify and strip each item once, dropping empties."""
+    return [text for x in items if (text := str(x).strip())]
+
+
+def _first(item: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    # First truthy value, matching the `a or b or c` fallback of the file format.
+    return next((value for key in keys if (value := item.get(key))), None)
+
 
 @dataclass(frozen=True)
 class AccountProfile:
@@ -31,7 +48,7 @@ class AccountProfile:
             raise ValueError("AccountProfile.id is required")
         name = (self.name or "").strip() or None
         direct_login = (self.direct_client_login or "").strip() or None
-        counters = [str(x).strip() for x in (self.metrica_counter_ids or []) if str(x).strip()]
+        counters = clean_str_list(self.metrica_counter_ids or [])
         return AccountProfile(
             id=account_id,
             name=name,
@@ -39,6 +56,31 @@ class AccountProfile:
             metrica_counter_ids=counters or None,
         )
 
+    def to_public_dict(self) -> dict[str, Any]:
+        """Registry/tool representation: non-empty fields only, in field order."""
+        data: dict[str, Any] = {"id": self.id}
+        if self.name:
+            data["name"] = self.name
+        if self.direct_client_login:
+            data["direct_client_login"] = self.direct_client_login
+        if self.metrica_counter_ids:
+            data["metrica_counter_ids"] = list(self.metrica_counter_ids)
+        return data
+
+    @classmethod
+    def from_raw(cls, item: dict[str, Any]) -> "AccountProfile":
+        """Build a normalized profile from one registry record in a single step."""
+        account_id = str(item.get("id") or "").strip()
+        if not account_id:
+            raise ValueError("AccountProfile.id is required")
+        counters = clean_str_list(_first(item, _COUNTER_KEYS) or [])
+        return cls(
+            id=account_id,
+            name=(item.get("name") or "").strip() or None,
+            direct_client_login=(_first(item, _LOGIN_KEYS) or "").strip() or None,
+            metrica_counter_ids=counters or None,
+        )
+
 
 def _parse_registry_payload(payload: Any) -> list[dict[str, Any]]:
     if isinstance(payload, list):
@@ -51,14 +93,42 @@ def _parse_registry_payload(payload: Any) -> list[dict[str, Any]]:
     raise ValueError("Accounts registry must be a list or an object with 'accounts' array")
 
 
+# path -> ((st_mtime_ns, st_size), parsed registry); see `load_accounts_registry`.
+_REGISTRY_CACHE: dict[str, tuple[tuple[int, int], dict[str, AccountProfile]]] = {}
+
+
+def invalidate(path: str | None) -> None:
+    """Drop the cached parse of `path` (call after rewriting the file)."""
+    if path:
+        _REGISTRY_CACHE.pop(str(path), None)
+
+
 def load_accounts_registry(path: str | None) -> dict[str, AccountProfile]:
+    """Parse the registry at `path`; unchanged files are served from memory.
+
+    The cache is keyed on the file's mtime and size. Callers get a fresh dict,
+    ordered by account id, each time and may mutate it freely.
+    """
     if not path:
         return {}
 
+    key = str(path)
     file_path = Path(path)
     try:
-        raw = file_path.read_text(encoding="utf-8")
-        payload = json.loads(raw)
+        st = file_path.stat()
+    except FileNotFoundError:
+        _REGISTRY_CACHE.pop(key, None)
+        return {}
+    except OSError as exc:
+        logger.warning("Failed to read accounts registry file: %s (%s)", path, exc.__class__.__name__)
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _REGISTRY_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
+    try:
+        payload = _loads(file_path.read_bytes())
     except FileNotFoundError:
         return {}
     except Exception as exc:
@@ -69,17 +139,14 @@ def load_accounts_registry(path: str | None) -> dict[str, AccountProfile]:
     try:
         items = _parse_registry_payload(payload)
         for item in items:
-            profile = AccountProfile(
-                id=str(item.get("id") or ""),
-                name=item.get("name"),
-                direct_client_login=item.get("direct_client_login") or item.get("directClientLogin"),
-                metrica_counter_ids=item.get("metrica_counter_ids")
-                or item.get("metricaCounterIds")
-                or item.get("metrica_counters"),
-            ).normalized()
+            profile = AccountProfile.from_raw(item)
             accounts[profile.id] = profile
     except Exception as exc:
         logger.warning("Failed to parse accounts registry file: %s (%s)", path, exc.__class__.__name__)
         return {}
 
-    return accounts
+    # Ordered by id: readers can iterate as-is, and writers' `sorted()` passes
+    # (accounts_store) see already-ordered input, which timsort does in O(N).
+    accounts = dict(sorted(accounts.items()))
+    _REGISTRY_CACHE[key] = (stamp, accounts)
+    return dict(accounts)
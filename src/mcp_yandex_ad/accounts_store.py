@@ -6,41 +6,58 @@ This module manages a non-secret JSON file (usually mounted from host) that maps
 
 from __future__ import annotations
 
-from dataclasses import asdict
 import errno
-import json
 from pathlib import Path
 from typing import Any
 
-from .accounts import AccountProfile, load_accounts_registry
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    orjson = None
 
-
-def _profile_to_json(profile: AccountProfile) -> dict[str, Any]:
-    data = asdict(profile)
-    # Keep file clean: drop nulls.
-    return {k: v for k, v in data.items() if v not in (None, [], {})}
+from .accounts import AccountProfile, clean_str_list, invalidate, load_accounts_registry
 
 
 def _to_payload(accounts: dict[str, AccountProfile]) -> dict[str, Any]:
-    ordered = [accounts[k] for k in sorted(accounts.keys())]
-    return {"accounts": [_profile_to_json(p) for p in ordered]}
+    return {"accounts": [accounts[k].to_public_dict() for k in sorted(accounts)]}
+
+
+def _dumps(payload: dict[str, Any]) -> bytes:
+    # UTF-8, 2-space indent, trailing newline; both branches emit identical bytes.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    import json
+
+    return (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
 
 
-def _write_atomic(path: Path, payload: dict[str, Any]) -> None:
-    if not path.parent.exists():
-        raise FileNotFoundError(f"Accounts registry directory does not exist: {path.parent}")
+def _write_atomic(path: Path, payload: dict[str, Any]) -> bool:
+    """Write `payload` to `path`; return False (no write) if the file already matches."""
+    data = _dumps(payload)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
     tmp_path = path.with_name(f"{path.name}.tmp")
-    data = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
     try:
-        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.write_bytes(data)
         tmp_path.replace(path)
+    except FileNotFoundError as exc:
+        # tmp_path sits next to `path`, so ENOENT here means the directory is missing.
+        raise FileNotFoundError(
+            f"Accounts registry directory does not exist: {path.parent}"
+        ) from exc
     except OSError as exc:
         # When the registry file is mounted as a writable file inside a read-only directory
         # (common for Docker setups), we can't create temp files. Fall back to in-place write.
         if exc.errno in {errno.EROFS, errno.EACCES}:
-            path.write_text(data, encoding="utf-8")
-            return
+            path.write_bytes(data)
+            return True
         raise
+    finally:
+        invalidate(str(path))
+    return True
 
 
 def read_accounts_file(path: str | None) -> dict[str, Any]:
@@ -48,7 +65,8 @@ def read_accounts_file(path: str | None) -> dict[str, Any]:
     return {
         "path": path,
         "count": len(accounts),
-        "accounts": [_profile_to_json(p) for p in [accounts[k] for k in sorted(accounts.keys())]],
+        # load_accounts_registry returns profiles already ordered by id.
+        "accounts": [profile.to_public_dict() for profile in accounts.values()],
     }
 
 
@@ -87,9 +105,9 @@ def upsert_account(
         if value is None:
             counters = None
         elif isinstance(value, list):
-            counters = [str(x).strip() for x in value if str(x).strip()]
+            counters = clean_str_list(value)
         else:
-            counters = [str(value).strip()] if str(value).strip() else None
+            counters = clean_str_list([value]) or None
 
     profile = AccountProfile(
         id=normalized_id,
@@ -101,12 +119,15 @@ def upsert_account(
     created = existing is None
     accounts[profile.id] = profile
 
-    _write_atomic(Path(path), _to_payload(accounts))
-    return {
+    written = _write_atomic(Path(path), _to_payload(accounts))
+    result = {
         "created": created,
-        "account": _profile_to_json(profile),
+        "account": profile.to_public_dict(),
         "count": len(accounts),
     }
+    if not written:
+        result["unchanged"] = True
+    return result
 
 
 def delete_account(path: str | None, *, account_id: str) -> dict[str, Any]:
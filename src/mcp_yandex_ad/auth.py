@@ -1,16 +1,46 @@
 """Token handling for Yandex OAuth (access + refresh)."""
 
 from dataclasses import dataclass
+import hashlib
+import json
 import logging
+import os
+from pathlib import Path
+import threading
+import time
 from typing import Any
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import AppConfig
 
 logger = logging.getLogger("yandex-direct-metrica-mcp")
 
 TOKEN_URL = "https://oauth.yandex.ru/token"
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Refresh this long before expiry; inside the window the current token is still
+# served while a background refresh runs.
+REFRESH_SKEW_SECONDS = 300
+
+
+def _build_session() -> requests.Session:
+    # One keep-alive pool for token requests per process. POST is not in
+    # urllib3's retryable methods, so only connection failures are retried.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
 
 
 @dataclass
@@ -24,18 +54,114 @@ class TokenManager:
     def __init__(self, config: AppConfig) -> None:
         self._config = config
         self._access_token: str | None = config.access_token
+        # Wall-clock expiry (epoch seconds); None when unknown (static token).
+        self._expires_at: float | None = None
+        self._background_refresh: threading.Thread | None = None
+        # Serializes refreshes so concurrent callers share one token request.
+        self._refresh_lock = threading.Lock()
+        self._refresh_body: bytes | None = None
+
+    def _is_fresh(self, now: float) -> bool:
+        return bool(self._access_token) and (
+            self._expires_at is None or now < self._expires_at - REFRESH_SKEW_SECONDS
+        )
 
     def get_access_token(self) -> str | None:
-        if self._access_token:
+        if not self._access_token and self._config.refresh_token:
+            self._load_cached_token()
+
+        now = time.time()
+        if self._is_fresh(now):
             return self._access_token
         if not self._config.refresh_token:
-            return None
-        refreshed = self._refresh_access_token()
-        if refreshed:
-            self._access_token = refreshed.value
-            return refreshed.value
+            return self._access_token
+
+        if self._access_token and self._expires_at is not None and now < self._expires_at:
+            self._start_background_refresh()
+            return self._access_token
+
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock.
+            if self._is_fresh(time.time()):
+                return self._access_token
+            refreshed = self._refresh_access_token()
+            if refreshed:
+                self._store_token(refreshed)
+                return refreshed.value
         return None
 
+    def _start_background_refresh(self) -> None:
+        if self._background_refresh is not None and self._background_refresh.is_alive():
+            return
+
+        def _run() -> None:
+            with self._refresh_lock:
+                if self._is_fresh(time.time()):
+                    return
+                refreshed = self._refresh_access_token()
+                if refreshed:
+                    self._store_token(refreshed)
+
+        self._background_refresh = threading.Thread(
+            target=_run, name="yandex-token-refresh", daemon=True
+        )
+        self._background_refresh.start()
+
+    def _store_token(self, token: AccessToken) -> None:
+        self._access_token = token.value
+        self._expires_at = time.time() + token.expires_in if token.expires_in else None
+        self._save_cached_token()
+
+    def _cache_fingerprint(self) -> str:
+        # Ties a cache entry to one OAuth app *and* one grant: apps can be shared
+        # between Yandex users and refresh tokens rotate.
+        raw = f"{self._config.client_id or ''}\0{self._config.refresh_token or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load_cached_token(self) -> None:
+        path = self._config.token_cache_file
+        if not path:
+            return
+        try:
+            payload = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable token cache file (%s)", exc.__class__.__name__)
+            return
+        if not isinstance(payload, dict) or payload.get("fingerprint") != self._cache_fingerprint():
+            return
+        access_token = payload.get("access_token")
+        expires_at = payload.get("expires_at")
+        if not isinstance(access_token, str) or not isinstance(expires_at, (int, float)):
+            return
+        if expires_at <= time.time():
+            return
+        self._access_token = access_token
+        self._expires_at = float(expires_at)
+
+    def _save_cached_token(self) -> None:
+        path = self._config.token_cache_file
+        if not path or not self._access_token or self._expires_at is None:
+            return
+        file_path = Path(path).expanduser()
+        data = json.dumps(
+            {
+                "fingerprint": self._cache_fingerprint(),
+                "access_token": self._access_token,
+                "expires_at": self._expires_at,
+            }
+        )
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)  # tighten a pre-existing file as well
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(data)
+        except OSError as exc:
+            logger.warning("Failed to write token cache file (%s)", exc.__class__.__name__)
+
     def _refresh_access_token(self) -> AccessToken | None:
         if not all(
             [self._config.client_id, self._config.client_secret, self._config.refresh_token]
@@ -43,15 +169,21 @@ class TokenManager:
             logger.warning("Missing OAuth client credentials for token refresh")
             return None
 
-        data = {
-            "grant_type": "refresh_token",
-            "refresh_token": self._config.refresh_token,
-            "client_id": self._config.client_id,
-            "client_secret": self._config.client_secret,
-        }
+        if self._refresh_body is None:
+            # The form is fixed for this manager's config; encode it once.
+            self._refresh_body = urlencode(
+                {
+                    "grant_type": "refresh_token",
+                    "refresh_token": self._config.refresh_token,
+                    "client_id": self._config.client_id,
+                    "client_secret": self._config.client_secret,
+                }
+            ).encode("ascii")
 
         try:
-            response = requests.post(TOKEN_URL, data=data, timeout=30)
+            response = _SESSION.post(
+                TOKEN_URL, data=self._refresh_body, headers=_FORM_HEADERS, timeout=(5, 30)
+            )
             response.raise_for_status()
         except requests.RequestException as exc:
             logger.error("Failed to refresh token: %s", exc)
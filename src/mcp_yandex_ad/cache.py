@@ -2,34 +2,57 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
 import time
 from typing import Any, Callable
 
-
-@dataclass
-class _Entry:
-    value: Any
-    expires_at: float
+# (expires_at, value)
+_Entry = tuple[float, Any]
 
 
 class TTLCache:
-    def __init__(self, ttl_seconds: float, *, now: Callable[[], float] | None = None) -> None:
+    """TTL cache with a size cap.
+
+    Entries are kept in write order. All entries share one TTL, so that is
+    also expiry order: `set` drops expired entries from the front, and when the
+    cap is hit it evicts the entry that would expire next anyway.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        max_size: int = 1024,
+        now: Callable[[], float] | None = None,
+    ) -> None:
         self._ttl_seconds = float(ttl_seconds)
+        self._max_size = max(1, int(max_size))
         self._now = now or time.monotonic
-        self._items: dict[str, _Entry] = {}
+        self._items: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
 
     def get(self, key: str) -> Any | None:
         entry = self._items.get(key)
         if entry is None:
             return None
-        if entry.expires_at <= self._now():
+        expires_at, value = entry
+        if expires_at <= self._now():
             self._items.pop(key, None)
             return None
-        return entry.value
+        return value
 
     def set(self, key: str, value: Any) -> None:
-        self._items[key] = _Entry(value=value, expires_at=self._now() + self._ttl_seconds)
+        now = self._now()
+        items = self._items
+        items.pop(key, None)
+        while items:
+            oldest_expires_at = next(iter(items.values()))[0]
+            if oldest_expires_at > now and len(items) < self._max_size:
+                break
+            items.popitem(last=False)
+        items[key] = (now + self._ttl_seconds, value)
 
     def clear(self) -> None:
         self._items.clear()
@@ -41,4 +64,3 @@ class TTLCache:
         value = factory()
         self.set(key, value)
         return value
-
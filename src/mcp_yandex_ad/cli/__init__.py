@@ -0,0 +1 @@
+"""Standalone diagnostic commands (`mcp-check-direct`, `mcp-check-metrica`, `mcp-health`)."""
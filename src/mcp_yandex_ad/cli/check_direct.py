@@ -0,0 +1,67 @@
+"""Check access to Yandex Direct.
+
+Reads config from `.env` / environment via `load_config()` and verifies access by
+calling Direct API (a minimal `campaigns.get` request).
+
+This script avoids printing any secrets. On failure it prints a normalized error
+payload with endpoint/request_id when available.
+"""
+
+from __future__ import annotations
+
+import json
+
+from ..config import load_config, load_dotenv_once
+
+
+def main() -> int:
+    load_dotenv_once()
+    config = load_config()
+
+    # Deferred so `.env`/config problems surface before the auth/client stack loads.
+    from ..auth import TokenManager
+    from ..clients import build_clients
+
+    tokens = TokenManager(config)
+    access_token = tokens.get_access_token()
+    if not access_token:
+        print("Missing access token. Set YANDEX_ACCESS_TOKEN or refresh credentials.")
+        return 1
+
+    clients = build_clients(config, access_token)
+    if clients.direct is None:
+        print("Direct client not configured (missing dependencies or token).")
+        return 1
+
+    try:
+        campaigns = clients.direct.campaigns().post(
+            data={
+                "method": "get",
+                "params": {
+                    "SelectionCriteria": {},
+                    "FieldNames": ["Id"],
+                    # One item is enough to prove access; `LimitedBy` flags more pages.
+                    "Page": {"Limit": 1},
+                },
+            }
+        )
+        result = campaigns.data.get("result", {})
+        count = result.get("TotalNumberOfItems")
+        if count is None:
+            count = len(result.get("Campaigns", []))
+            if result.get("LimitedBy") is not None:
+                count = f"{count}+"
+        print(
+            f"Direct OK: campaigns.get returned {count} campaigns "
+            f"(sandbox={config.use_sandbox}, api_version={config.direct_api_version})"
+        )
+        return 0
+    except Exception as exc:  # pragma: no cover - runtime safety
+        from ..errors import normalize_error
+
+        print(json.dumps(normalize_error("direct.check_access", exc), ensure_ascii=False))
+        return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+"""Check access to configured Yandex Metrica counters.
+
+Reads `YANDEX_METRICA_COUNTER_IDS` from environment via `load_config()` and
+verifies access by calling:
+- Management API: `counter.get` (metadata access)
+- Stats API: a small report (data access)
+
+Counters are checked concurrently (bounded); output keeps the configured order.
+
+This script prints only counter IDs and minimal metadata (name) and avoids
+printing any secrets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import functools
+from typing import TYPE_CHECKING
+
+from ..config import load_config, load_dotenv_once
+
+if TYPE_CHECKING:
+    from ..clients import YandexClients
+
+
+@functools.lru_cache(maxsize=8)
+def _ordinal_range(today: int, days: int) -> tuple[str, str]:
+    return dt.date.fromordinal(today - days).isoformat(), dt.date.fromordinal(today).isoformat()
+
+
+def _today_range(days: int = 7) -> tuple[str, str]:
+    return _ordinal_range(dt.date.today().toordinal(), days)
+
+
+# Counters are checked concurrently; cap in-flight counters to stay polite to the API.
+_MAX_CONCURRENCY = 8
+
+
+def _check_management(clients: YandexClients, counter_id: str) -> tuple[bool, str]:
+    if clients.metrica_management is None:
+        return True, "  management: SKIPPED (client not configured)"
+    try:
+        info = clients.metrica_management.counter(counterId=counter_id).get()
+        counter = info.data.get("counter", {})
+        name = counter.get("name")
+        return True, f"  management: OK (name={name!r})"
+    except Exception as exc:  # pragma: no cover - runtime safety
+        return False, f"  management: FAILED ({exc.__class__.__name__}: {exc})"
+
+
+def _check_stats(
+    clients: YandexClients, counter_id: str, date_from: str, date_to: str
+) -> tuple[bool, str]:
+    if clients.metrica_stats is None:
+        return True, "  stats: SKIPPED (client not configured)"
+    try:
+        report = clients.metrica_stats.stats().get(
+            params={
+                "ids": counter_id,
+                "metrics": "ym:s:visits",
+                "dimensions": "ym:s:date",
+                "date1": date_from,
+                "date2": date_to,
+                "sort": "ym:s:date",
+                "limit": 1,
+            }
+        )
+        # `limit=1` keeps the body tiny; `total_rows` still reports the full size.
+        data = report.data
+        rows = data.get("total_rows", len(data.get("data", [])))
+        return True, f"  stats: OK (rows={rows})"
+    except Exception as exc:  # pragma: no cover - runtime safety
+        return False, f"  stats: FAILED ({exc.__class__.__name__}: {exc})"
+
+
+async def _check_counter(
+    semaphore: asyncio.Semaphore,
+    clients: YandexClients,
+    counter_id: str,
+    accessible_ids: set[str],
+    date_from: str,
+    date_to: str,
+) -> tuple[bool, list[str]]:
+    lines = [f"counter_id={counter_id}"]
+    if accessible_ids:
+        lines.append(f"  in list_counters: {'YES' if counter_id in accessible_ids else 'NO'}")
+
+    # tapi clients are blocking; management and stats live on different hosts,
+    # so both calls for a counter run in parallel worker threads.
+    async with semaphore:
+        (mgmt_ok, mgmt_line), (stats_ok, stats_line) = await asyncio.gather(
+            asyncio.to_thread(_check_management, clients, counter_id),
+            asyncio.to_thread(_check_stats, clients, counter_id, date_from, date_to),
+        )
+    lines += (mgmt_line, stats_line)
+    return mgmt_ok and stats_ok, lines
+
+
+async def _check_counters(
+    clients: YandexClients,
+    counter_ids: list[str],
+    accessible_ids: set[str],
+    date_from: str,
+    date_to: str,
+) -> list[tuple[bool, list[str]]]:
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return await asyncio.gather(
+        *[
+            _check_counter(semaphore, clients, counter_id, accessible_ids, date_from, date_to)
+            for counter_id in counter_ids
+        ]
+    )
+
+
+def main() -> int:
+    load_dotenv_once()
+    config = load_config()
+    if not config.metrica_counter_ids:
+        print("No counters configured. Set YANDEX_METRICA_COUNTER_IDS=...")
+        return 1
+
+    # Deferred so the early exits above skip the auth/client stack.
+    from ..auth import TokenManager
+    from ..clients import build_clients
+
+    tokens = TokenManager(config)
+    access_token = tokens.get_access_token()
+    if not access_token:
+        print("Missing access token. Set YANDEX_ACCESS_TOKEN or refresh credentials.")
+        return 1
+
+    clients = build_clients(config, access_token)
+    if clients.metrica_management is None and clients.metrica_stats is None:
+        print("Metrica clients are not configured (missing token scopes or dependencies).")
+        return 1
+
+    date_from, date_to = _today_range(7)
+    ok = True
+
+    accessible_ids: set[str] = set()
+    if clients.metrica_management is not None:
+        try:
+            counters = clients.metrica_management.counters().get().data.get("counters", [])
+            for c in counters:
+                if isinstance(c, dict) and "id" in c:
+                    accessible_ids.add(str(c["id"]))
+            print(f"Accessible counters via API: {len(accessible_ids)}")
+        except Exception as exc:  # pragma: no cover - runtime safety
+            ok = False
+            print(f"Failed to list counters: {exc.__class__.__name__}: {exc}")
+
+    results = asyncio.run(
+        _check_counters(clients, config.metrica_counter_ids, accessible_ids, date_from, date_to)
+    )
+    # Print in configured order so the output matches the sequential version.
+    for counter_ok, lines in results:
+        ok = ok and counter_ok
+        for line in lines:
+            print(line)
+
+    return 0 if ok else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
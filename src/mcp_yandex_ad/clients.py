@@ -1,27 +1,46 @@
 """Client wrappers for Yandex Direct and Metrica."""
 
 from dataclasses import dataclass
+import functools
 import logging
 
 from .config import AppConfig
 
 logger = logging.getLogger("yandex-direct-metrica-mcp")
 
-try:
-    from tapi_yandex_direct import YandexDirect
-    from tapi_yandex_metrika import (
-        YandexMetrikaLogsapi,
-        YandexMetrikaManagement,
-        YandexMetrikaStats,
-    )
-    from .direct_v501 import YandexDirectV501
-except ImportError as exc:  # pragma: no cover - runtime dependency
-    YandexDirect = None
-    YandexDirectV501 = None
-    YandexMetrikaLogsapi = None
-    YandexMetrikaManagement = None
-    YandexMetrikaStats = None
-    logger.debug("Optional dependency missing: %s", exc)
+
+# The tapi SDKs (and the v501 resource mapping) are imported on first use, so
+# importing this module stays cheap and Metrica-only runs never load the v501
+# adapter.
+@functools.cache
+def _direct_class(api_version: str) -> type | None:
+    try:
+        from tapi_yandex_direct import YandexDirect
+    except ImportError as exc:  # pragma: no cover - runtime dependency
+        logger.debug("Optional dependency missing: %s", exc)
+        return None
+    if api_version != "v501":
+        return YandexDirect
+    try:
+        from .direct_v501 import YandexDirectV501
+    except ImportError as exc:  # pragma: no cover - runtime dependency
+        logger.warning("Direct v501 requested but dependency missing; using v5. (%s)", exc)
+        return YandexDirect
+    return YandexDirectV501
+
+
+@functools.cache
+def _metrica_classes() -> tuple[type, type, type] | None:
+    try:
+        from tapi_yandex_metrika import (
+            YandexMetrikaLogsapi,
+            YandexMetrikaManagement,
+            YandexMetrikaStats,
+        )
+    except ImportError as exc:  # pragma: no cover - runtime dependency
+        logger.debug("Optional dependency missing: %s", exc)
+        return None
+    return YandexMetrikaManagement, YandexMetrikaStats, YandexMetrikaLogsapi
 
 
 @dataclass
@@ -32,32 +51,51 @@ class YandexClients:
     metrica_logs: object | None
 
 
-def build_direct_client(
-    config: AppConfig,
-    access_token: str | None,
-    *,
-    direct_client_login: str | None = None,
+# Client wrappers are reused per (token, settings): SSE sessions and per-login
+# overrides in one process then share instances instead of rebuilding them.
+# A refreshed token is a new key; old entries age out of the LRU.
+@functools.lru_cache(maxsize=8)
+def _direct_client(
+    access_token: str, login: str | None, is_sandbox: bool, api_version: str
 ) -> object | None:
-    if not access_token or not YandexDirect:
+    direct_class = _direct_class(api_version)
+    if direct_class is None:
         return None
-
-    direct_class = YandexDirect
-    if config.direct_api_version == "v501":
-        if YandexDirectV501 is None:
-            logger.warning("Direct v501 requested but dependency missing; using v5.")
-        else:
-            direct_class = YandexDirectV501
-
-    login = (direct_client_login or config.direct_client_login or None)
     return direct_class(
         access_token=access_token,
         login=login,
-        is_sandbox=config.use_sandbox,
+        is_sandbox=is_sandbox,
         retry_if_exceeded_limit=True,
         retries_if_server_error=5,
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _metrica_clients(access_token: str) -> tuple[object, object, object] | None:
+    metrica_classes = _metrica_classes()
+    if metrica_classes is None:
+        return None
+    return tuple(cls(access_token=access_token) for cls in metrica_classes)
+
+
+def clear_client_cache() -> None:
+    """Forget shared client instances (e.g. after credentials change)."""
+    _direct_client.cache_clear()
+    _metrica_clients.cache_clear()
+
+
+def build_direct_client(
+    config: AppConfig,
+    access_token: str | None,
+    *,
+    direct_client_login: str | None = None,
+) -> object | None:
+    if not access_token:
+        return None
+    login = (direct_client_login or config.direct_client_login or None)
+    return _direct_client(access_token, login, config.use_sandbox, config.direct_api_version)
+
+
 def build_clients(config: AppConfig, access_token: str | None) -> YandexClients:
     if not access_token:
         return YandexClients(
@@ -69,10 +107,9 @@ def build_clients(config: AppConfig, access_token: str | None) -> YandexClients:
     metrica_management = None
     metrica_stats = None
     metrica_logs = None
-    if YandexMetrikaManagement and YandexMetrikaStats and YandexMetrikaLogsapi:
-        metrica_management = YandexMetrikaManagement(access_token=access_token)
-        metrica_stats = YandexMetrikaStats(access_token=access_token)
-        metrica_logs = YandexMetrikaLogsapi(access_token=access_token)
+    metrica = _metrica_clients(access_token)
+    if metrica is not None:
+        metrica_management, metrica_stats, metrica_logs = metrica
 
     return YandexClients(
         direct=direct_client,
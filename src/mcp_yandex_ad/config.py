@@ -1,6 +1,7 @@
 """Configuration helpers for MCP Yandex Direct + Metrica."""
 
 from dataclasses import dataclass, field
+import functools
 import os
 
 from .accounts import AccountProfile, load_accounts_registry
@@ -34,64 +35,152 @@ class AppConfig:
     accounts_write_enabled: bool = False
     accounts_file: str | None = None
     accounts: dict[str, AccountProfile] = field(default_factory=dict)
+    token_cache_file: str | None = None
 
 
 def _split_csv(value: str | None) -> list[str]:
     if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [stripped for item in value.split(",") if (stripped := item.strip())]
+
+
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
+def _env_bool(env: dict[str, str], key: str, default: bool) -> bool:
+    value = env.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+_VERSION_MAP = {"v5": "v5", "5": "v5", "v501": "v501", "501": "v501"}
 
 
 def _normalize_direct_api_version(value: str | None) -> str:
     if not value:
         return "v5"
-    normalized = value.strip().lower()
-    if normalized in {"v5", "5"}:
-        return "v5"
-    if normalized in {"v501", "501"}:
-        return "v501"
-    return "v5"
+    return _VERSION_MAP.get(value.strip().lower(), "v5")
 
 
-def load_config() -> AppConfig:
-    direct_client_login = os.getenv("YANDEX_DIRECT_CLIENT_LOGIN")
-    direct_client_logins = _split_csv(os.getenv("YANDEX_DIRECT_CLIENT_LOGINS"))
+# Every variable read by `_build_config`; their values form the config cache key.
+_ENV_KEYS = (
+    "YANDEX_DIRECT_CLIENT_LOGIN",
+    "YANDEX_DIRECT_CLIENT_LOGINS",
+    "MCP_ACCOUNTS_FILE",
+    "YANDEX_ACCESS_TOKEN",
+    "YANDEX_REFRESH_TOKEN",
+    "YANDEX_CLIENT_ID",
+    "YANDEX_CLIENT_SECRET",
+    "YANDEX_DIRECT_API_VERSION",
+    "YANDEX_METRICA_COUNTER_IDS",
+    "YANDEX_DIRECT_SANDBOX",
+    "MCP_WRITE_ENABLED",
+    "MCP_WRITE_SANDBOX_ONLY",
+    "HF_ENABLED",
+    "HF_WRITE_ENABLED",
+    "HF_DESTRUCTIVE_ENABLED",
+    "MCP_CACHE_ENABLED",
+    "MCP_CACHE_TTL_SECONDS",
+    "MCP_DIRECT_RATE_LIMIT_RPS",
+    "MCP_METRICA_RATE_LIMIT_RPS",
+    "MCP_RETRY_MAX_ATTEMPTS",
+    "MCP_RETRY_BASE_DELAY_SECONDS",
+    "MCP_RETRY_MAX_DELAY_SECONDS",
+    "MCP_CONTENT_MODE",
+    "MCP_PUBLIC_READONLY",
+    "MCP_ACCOUNTS_WRITE_ENABLED",
+    "MCP_TOKEN_CACHE_FILE",
+)
+
+_DOTENV_LOADED: set[str | None] = set()
+
+
+def load_dotenv_once(env_file: str | None = None) -> None:
+    """Load `env_file` (default: nearest `.env`) into the environment, once per file."""
+    if env_file in _DOTENV_LOADED:
+        return
+    from dotenv import load_dotenv
+
+    if env_file:
+        load_dotenv(env_file)
+    else:
+        load_dotenv()
+    _DOTENV_LOADED.add(env_file)
+
+
+def clear_dotenv_cache() -> None:
+    """Allow the next `load_dotenv_once` call to re-read `.env` files."""
+    _DOTENV_LOADED.clear()
+
+
+def _registry_stamp(path: str | None) -> tuple[int, int] | None:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _build_config(env: dict[str, str]) -> AppConfig:
+    direct_client_login = env.get("YANDEX_DIRECT_CLIENT_LOGIN")
+    direct_client_logins = _split_csv(env.get("YANDEX_DIRECT_CLIENT_LOGINS"))
     if not direct_client_logins and direct_client_login:
         direct_client_logins = [direct_client_login.strip()]
-    accounts_file = os.getenv("MCP_ACCOUNTS_FILE") or None
+    accounts_file = env.get("MCP_ACCOUNTS_FILE") or None
     accounts = load_accounts_registry(accounts_file)
     return AppConfig(
-        access_token=os.getenv("YANDEX_ACCESS_TOKEN"),
-        refresh_token=os.getenv("YANDEX_REFRESH_TOKEN"),
-        client_id=os.getenv("YANDEX_CLIENT_ID"),
-        client_secret=os.getenv("YANDEX_CLIENT_SECRET"),
+        access_token=env.get("YANDEX_ACCESS_TOKEN"),
+        refresh_token=env.get("YANDEX_REFRESH_TOKEN"),
+        client_id=env.get("YANDEX_CLIENT_ID"),
+        client_secret=env.get("YANDEX_CLIENT_SECRET"),
         direct_client_login=direct_client_login,
         direct_client_logins=direct_client_logins,
         direct_api_version=_normalize_direct_api_version(
-            os.getenv("YANDEX_DIRECT_API_VERSION")
+            env.get("YANDEX_DIRECT_API_VERSION")
         ),
-        metrica_counter_ids=_split_csv(os.getenv("YANDEX_METRICA_COUNTER_IDS")),
-        use_sandbox=os.getenv("YANDEX_DIRECT_SANDBOX", "false").lower()
-        in {"1", "true", "yes"},
-        write_enabled=os.getenv("MCP_WRITE_ENABLED", "false").lower()
-        in {"1", "true", "yes"},
-        write_sandbox_only=os.getenv("MCP_WRITE_SANDBOX_ONLY", "true").lower()
-        in {"1", "true", "yes"},
-        hf_enabled=os.getenv("HF_ENABLED", "true").lower() in {"1", "true", "yes"},
-        hf_write_enabled=os.getenv("HF_WRITE_ENABLED", "false").lower() in {"1", "true", "yes"},
-        hf_destructive_enabled=os.getenv("HF_DESTRUCTIVE_ENABLED", "false").lower()
-        in {"1", "true", "yes"},
-        cache_enabled=os.getenv("MCP_CACHE_ENABLED", "true").lower() in {"1", "true", "yes"},
-        cache_ttl_seconds=int(os.getenv("MCP_CACHE_TTL_SECONDS", "300")),
-        direct_rate_limit_rps=int(os.getenv("MCP_DIRECT_RATE_LIMIT_RPS", "0")),
-        metrica_rate_limit_rps=int(os.getenv("MCP_METRICA_RATE_LIMIT_RPS", "0")),
-        retry_max_attempts=int(os.getenv("MCP_RETRY_MAX_ATTEMPTS", "3")),
-        retry_base_delay_seconds=float(os.getenv("MCP_RETRY_BASE_DELAY_SECONDS", "0.5")),
-        retry_max_delay_seconds=float(os.getenv("MCP_RETRY_MAX_DELAY_SECONDS", "8")),
-        content_mode=(os.getenv("MCP_CONTENT_MODE", "json") or "json").strip().lower(),
-        public_readonly=os.getenv("MCP_PUBLIC_READONLY", "false").lower() in {"1", "true", "yes"},
-        accounts_write_enabled=os.getenv("MCP_ACCOUNTS_WRITE_ENABLED", "false").lower()
-        in {"1", "true", "yes"},
+        metrica_counter_ids=_split_csv(env.get("YANDEX_METRICA_COUNTER_IDS")),
+        use_sandbox=_env_bool(env, "YANDEX_DIRECT_SANDBOX", False),
+        write_enabled=_env_bool(env, "MCP_WRITE_ENABLED", False),
+        write_sandbox_only=_env_bool(env, "MCP_WRITE_SANDBOX_ONLY", True),
+        hf_enabled=_env_bool(env, "HF_ENABLED", True),
+        hf_write_enabled=_env_bool(env, "HF_WRITE_ENABLED", False),
+        hf_destructive_enabled=_env_bool(env, "HF_DESTRUCTIVE_ENABLED", False),
+        cache_enabled=_env_bool(env, "MCP_CACHE_ENABLED", True),
+        cache_ttl_seconds=int(env.get("MCP_CACHE_TTL_SECONDS", "300")),
+        direct_rate_limit_rps=int(env.get("MCP_DIRECT_RATE_LIMIT_RPS", "0")),
+        metrica_rate_limit_rps=int(env.get("MCP_METRICA_RATE_LIMIT_RPS", "0")),
+        retry_max_attempts=int(env.get("MCP_RETRY_MAX_ATTEMPTS", "3")),
+        retry_base_delay_seconds=float(env.get("MCP_RETRY_BASE_DELAY_SECONDS", "0.5")),
+        retry_max_delay_seconds=float(env.get("MCP_RETRY_MAX_DELAY_SECONDS", "8")),
+        content_mode=(env.get("MCP_CONTENT_MODE", "json") or "json").strip().lower(),
+        public_readonly=_env_bool(env, "MCP_PUBLIC_READONLY", False),
+        accounts_write_enabled=_env_bool(env, "MCP_ACCOUNTS_WRITE_ENABLED", False),
         accounts_file=accounts_file,
         accounts=accounts,
+        token_cache_file=env.get("MCP_TOKEN_CACHE_FILE") or None,
     )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(
+    env_items: tuple[tuple[str, str], ...],
+    registry_stamp: tuple[int, int] | None,  # noqa: ARG001 - part of the cache key
+) -> AppConfig:
+    return _build_config(dict(env_items))
+
+
+def load_config() -> AppConfig:
+    # Snapshot the relevant variables once; the snapshot plus the registry file
+    # stamp is the cache key, so env changes and registry edits are picked up.
+    env_items = tuple(
+        (key, value) for key in _ENV_KEYS if (value := os.environ.get(key)) is not None
+    )
+    accounts_file = os.environ.get("MCP_ACCOUNTS_FILE") or None
+    return _load_config_cached(env_items, _registry_stamp(accounts_file))
+
+
+def clear_config_cache() -> None:
+    _load_config_cached.cache_clear()
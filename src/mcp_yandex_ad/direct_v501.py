@@ -20,8 +20,9 @@ def _upgrade_resource_mapping(mapping: dict) -> dict:
     for key, value in mapping.items():
         resource = value.get("resource")
         if isinstance(resource, str) and "json/v5/" in resource:
-            resource = resource.replace("json/v5/", "json/v501/")
-        upgraded[key] = {**value, "resource": resource}
+            value = value.copy()
+            value["resource"] = resource.replace("json/v5/", "json/v501/", 1)
+        upgraded[key] = value
     return upgraded
 
 
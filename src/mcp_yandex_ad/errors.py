@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from functools import lru_cache, partial
+from typing import Any, Callable
 from urllib.parse import urlsplit, urlunsplit
 
+try:
+    import orjson
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, default=str).decode("utf-8")
+
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    import json
+
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+from requests.structures import CaseInsensitiveDict
 from tapi_yandex_direct import exceptions as direct_exceptions
 from tapi_yandex_metrika import exceptions as metrica_exceptions
 
@@ -15,6 +29,9 @@ HINT_UNITS = "Not enough units; retry later or reduce scope."
 HINT_REPORT = "Report not ready; retry later."
 HINT_PARAMS = "Check required parameters."
 
+# Plain dicts need both spellings; requests' case-insensitive headers need one.
+_REQUEST_ID_KEYS = ("X-Request-Id", "X-Request-ID")
+
 
 class MissingClientError(RuntimeError):
     def __init__(self, provider: str, message: str) -> None:
@@ -32,25 +49,27 @@ class WriteGuardError(RuntimeError):
 def _safe_message(value: Any) -> str | None:
     if value is None:
         return None
+    if type(value) is str:  # the common case; exact type keeps str subclasses on str()
+        return value
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=True)
+        return _dumps(value)
     return str(value)
 
 
+@lru_cache(maxsize=512)
 def _sanitize_url(url: str | None) -> str | None:
+    # Endpoints repeat per tool, so parsed results are memoized.
     if not url:
         return None
+    if "?" not in url and "#" not in url:
+        return url
     parts = urlsplit(url)
     if not parts.scheme or not parts.netloc:
         return url
     return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
 
 
-def _extract_http_info(exc: Exception) -> dict[str, Any]:
-    response = getattr(exc, "response", None)
-    if response is None:
-        return {}
-
+def _extract_http_info(response: Any) -> dict[str, Any]:
     info: dict[str, Any] = {}
     status_code = getattr(response, "status_code", None)
     reason = getattr(response, "reason", None)
@@ -65,59 +84,111 @@ def _extract_http_info(exc: Exception) -> dict[str, Any]:
 
     headers = getattr(response, "headers", None)
     if headers:
-        request_id = headers.get("X-Request-Id") or headers.get("X-Request-ID")
-        if request_id:
-            info["request_id"] = request_id
+        keys = _REQUEST_ID_KEYS[:1] if isinstance(headers, CaseInsensitiveDict) else _REQUEST_ID_KEYS
+        for key in keys:
+            request_id = headers.get(key)
+            if request_id:
+                info["request_id"] = request_id
+                break
 
     return info
 
 
-def normalize_error(tool: str, exc: Exception) -> dict[str, Any]:
-    payload: dict[str, Any] = {"tool": tool, "type": exc.__class__.__name__}
-    payload.update(_extract_http_info(exc))
-
-    if isinstance(exc, MissingClientError):
-        payload["provider"] = exc.provider
-        payload["message"] = str(exc)
-        payload["hint"] = HINT_TOKEN
-    elif isinstance(exc, WriteGuardError):
-        payload["provider"] = exc.provider
-        payload["message"] = str(exc)
-        payload["hint"] = exc.hint
-    elif isinstance(exc, direct_exceptions.YandexDirectClientError):
-        payload["provider"] = "direct"
-        payload["error_code"] = exc.error_code
-        payload["request_id"] = exc.request_id
-        payload["message"] = exc.error_string
-        payload["detail"] = exc.error_detail
-        if isinstance(exc, direct_exceptions.YandexDirectTokenError):
-            payload["hint"] = HINT_TOKEN
-        elif isinstance(exc, direct_exceptions.YandexDirectRequestsLimitError):
-            payload["hint"] = HINT_RATE_LIMIT
-        elif isinstance(exc, direct_exceptions.YandexDirectNotEnoughUnitsError):
-            payload["hint"] = HINT_UNITS
-    elif isinstance(exc, direct_exceptions.YandexDirectApiError):
-        payload["provider"] = "direct"
-        payload["message"] = _safe_message(getattr(exc, "data", None)) or "Direct API error"
-    elif isinstance(exc, metrica_exceptions.YandexMetrikaClientError):
-        payload["provider"] = "metrica"
-        payload["error_code"] = exc.code
-        payload["message"] = exc.message or "Metrica API error"
-        if exc.errors:
-            payload["details"] = exc.errors
-        if isinstance(exc, metrica_exceptions.YandexMetrikaTokenError):
-            payload["hint"] = HINT_TOKEN
-        elif isinstance(exc, metrica_exceptions.YandexMetrikaLimitError):
-            payload["hint"] = HINT_RATE_LIMIT
-        elif isinstance(exc, metrica_exceptions.YandexMetrikaDownloadReportError):
-            payload["hint"] = HINT_REPORT
-    elif isinstance(exc, metrica_exceptions.YandexMetrikaApiError):
-        payload["provider"] = "metrica"
-        payload["message"] = exc.message or "Metrica API error"
-    elif isinstance(exc, ValueError):
-        payload["message"] = str(exc)
-        payload["hint"] = HINT_PARAMS
-    else:
-        payload["message"] = str(exc)
+def _missing_client(exc: MissingClientError, payload: dict[str, Any]) -> None:
+    payload["provider"] = exc.provider
+    payload["message"] = str(exc)
+    payload["hint"] = HINT_TOKEN
+
+
+def _write_guard(exc: WriteGuardError, payload: dict[str, Any]) -> None:
+    payload["provider"] = exc.provider
+    payload["message"] = str(exc)
+    payload["hint"] = exc.hint
+
+
+def _direct_client(
+    exc: direct_exceptions.YandexDirectClientError,
+    payload: dict[str, Any],
+    hint: str | None = None,
+) -> None:
+    payload["provider"] = "direct"
+    payload["error_code"] = exc.error_code
+    payload["request_id"] = exc.request_id
+    payload["message"] = exc.error_string
+    payload["detail"] = exc.error_detail
+    if hint:
+        payload["hint"] = hint
+
+
+def _direct_api(exc: direct_exceptions.YandexDirectApiError, payload: dict[str, Any]) -> None:
+    payload["provider"] = "direct"
+    payload["message"] = _safe_message(getattr(exc, "data", None)) or "Direct API error"
 
+
+def _metrica_client(
+    exc: metrica_exceptions.YandexMetrikaClientError,
+    payload: dict[str, Any],
+    hint: str | None = None,
+) -> None:
+    payload["provider"] = "metrica"
+    payload["error_code"] = exc.code
+    payload["message"] = exc.message or "Metrica API error"
+    if exc.errors:
+        payload["details"] = exc.errors
+    if hint:
+        payload["hint"] = hint
+
+
+def _metrica_api(exc: metrica_exceptions.YandexMetrikaApiError, payload: dict[str, Any]) -> None:
+    payload["provider"] = "metrica"
+    payload["message"] = exc.message or "Metrica API error"
+
+
+def _value_error(exc: ValueError, payload: dict[str, Any]) -> None:
+    payload["message"] = str(exc)
+    payload["hint"] = HINT_PARAMS
+
+
+def _generic(exc: Exception, payload: dict[str, Any]) -> None:
+    payload["message"] = str(exc)
+
+
+_Handler = Callable[[Any, dict[str, Any]], None]
+
+# Exception class -> payload filler. Lookups walk the MRO, so the most specific
+# registered class wins; resolved subclasses are memoized into this dict.
+_HANDLERS: dict[type, _Handler] = {
+    MissingClientError: _missing_client,
+    WriteGuardError: _write_guard,
+    direct_exceptions.YandexDirectClientError: _direct_client,
+    direct_exceptions.YandexDirectTokenError: partial(_direct_client, hint=HINT_TOKEN),
+    direct_exceptions.YandexDirectRequestsLimitError: partial(_direct_client, hint=HINT_RATE_LIMIT),
+    direct_exceptions.YandexDirectNotEnoughUnitsError: partial(_direct_client, hint=HINT_UNITS),
+    direct_exceptions.YandexDirectApiError: _direct_api,
+    metrica_exceptions.YandexMetrikaClientError: _metrica_client,
+    metrica_exceptions.YandexMetrikaTokenError: partial(_metrica_client, hint=HINT_TOKEN),
+    metrica_exceptions.YandexMetrikaLimitError: partial(_metrica_client, hint=HINT_RATE_LIMIT),
+    metrica_exceptions.YandexMetrikaDownloadReportError: partial(
+        _metrica_client, hint=HINT_REPORT
+    ),
+    metrica_exceptions.YandexMetrikaApiError: _metrica_api,
+    ValueError: _value_error,
+}
+
+
+def _handler_for(cls: type) -> _Handler:
+    handler = _HANDLERS.get(cls)
+    if handler is None:
+        handler = next((_HANDLERS[base] for base in cls.__mro__ if base in _HANDLERS), _generic)
+        _HANDLERS[cls] = handler
+    return handler
+
+
+def normalize_error(tool: str, exc: Exception) -> dict[str, Any]:
+    cls = type(exc)
+    payload: dict[str, Any] = {"tool": tool, "type": cls.__name__}
+    response = getattr(exc, "response", None)
+    if response is not None:
+        payload.update(_extract_http_info(response))
+    _handler_for(cls)(exc, payload)
     return {"error": payload}
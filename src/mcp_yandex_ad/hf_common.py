@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal
 from typing import Any, Iterable
 
 
@@ -11,7 +12,7 @@ class HFError(RuntimeError):
     """Human-friendly layer error (actionable)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolveResult:
     ids: list[int]
     matches: list[dict[str, Any]]
@@ -62,10 +63,20 @@ def today_plus(days: int) -> str:
     return str(dt.date.today() + dt.timedelta(days=days))
 
 
-def micros_from_rub(value: float | int) -> int:
+def micros_from_rub(value: float | int | Decimal) -> int:
+    kind = type(value)
+    if kind is int:
+        return value * 1_000_000
+    if kind is Decimal:
+        return int((value * 1_000_000).to_integral_value(ROUND_HALF_EVEN))
     return int(round(float(value) * 1_000_000))
 
 
+def as_int(value: Any) -> int:
+    """`int(value)`, skipping the call for ids the JSON decoder already made ints."""
+    return value if type(value) is int else int(value)
+
+
 def dedupe_ints(values: Iterable[int]) -> list[int]:
-    return list(dict.fromkeys(int(v) for v in values))
+    return list(dict.fromkeys(map(int, values)))
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Callable
 
@@ -12,6 +13,8 @@ class RateLimiter:
         self._now = now or time.monotonic
         self._sleep = sleep or time.sleep
         self._timestamps: list[float] = []
+        # Callers may share one limiter across threads (e.g. concurrent HF reads).
+        self._lock = threading.Lock()
 
     @property
     def enabled(self) -> bool:
@@ -20,6 +23,10 @@ class RateLimiter:
     def acquire(self) -> None:
         if self._rps <= 0:
             return
+        with self._lock:
+            self._acquire_locked()
+
+    def _acquire_locked(self) -> None:
         now = self._now()
         window_start = now - 1.0
         while self._timestamps and self._timestamps[0] <= window_start:
@@ -410,6 +410,10 @@ class AppContext:
     accounts_registry_lock: threading.Lock = field(default_factory=threading.Lock)
     accounts_registry_cache: dict[str, AccountProfile] | None = None
     accounts_registry_mtime: float | None = None
+    # Bumped after every Direct mutation; invalidates cached HF name lookups.
+    direct_write_generation: int = 0
+    # HF update patch shape Direct accepted, per "<login>:<label>:<Type>".
+    hf_patch_shapes: dict[str, int] = field(default_factory=dict)
 
     # Convenience wrappers so HF modules don't have to import server internals.
     def _direct_get(self, resource: str, params: dict[str, Any]) -> dict[str, Any]:
@@ -2620,6 +2624,18 @@ class _RequestScopedContext:
     def config(self) -> AppConfig:
         return self.base.config
 
+    @property
+    def cache(self) -> TTLCache | None:
+        return self.base.cache
+
+    @property
+    def direct_write_generation(self) -> int:
+        return self.base.direct_write_generation
+
+    @property
+    def hf_patch_shapes(self) -> dict[str, int]:
+        return self.base.hf_patch_shapes
+
     def _direct_get(self, resource: str, params: dict[str, Any]) -> dict[str, Any]:
         return _direct_get(self.base, resource, params, direct_client_login=self.direct_client_login)
 
@@ -2702,12 +2718,17 @@ def _direct_call(
         response = resource_client.post(data=body)
         return response.data
 
-    return with_retries(
-        _call,
-        max_attempts=ctx.config.retry_max_attempts,
-        base_delay_seconds=ctx.config.retry_base_delay_seconds,
-        max_delay_seconds=ctx.config.retry_max_delay_seconds,
-    )
+    try:
+        return with_retries(
+            _call,
+            max_attempts=ctx.config.retry_max_attempts,
+            base_delay_seconds=ctx.config.retry_base_delay_seconds,
+            max_delay_seconds=ctx.config.retry_max_delay_seconds,
+        )
+    finally:
+        if method != "get":
+            # Even a failed call may have applied part of a batch.
+            ctx.direct_write_generation += 1
 
 
 def _metrica_get_management(
@@ -65,3 +65,42 @@ def test_tool_schemas_include_account_id(monkeypatch, tmp_path):
     assert dashboard_account_id["anyOf"][0]["enum"] == ["proj1"]
     assert "direct_client_login" in dashboard_schema["properties"]
     assert "return_data" in dashboard_schema["properties"]
+
+
+def test_accounts_registry_cache_returns_copies_and_sees_writes(tmp_path):
+    from mcp_yandex_ad.accounts import load_accounts_registry
+    from mcp_yandex_ad.accounts_store import upsert_account
+
+    registry_path = tmp_path / "accounts.json"
+    registry_path.write_text(json.dumps([{"id": "proj1"}]), encoding="utf-8")
+
+    first = load_accounts_registry(str(registry_path))
+    first.pop("proj1")
+    assert "proj1" in load_accounts_registry(str(registry_path))
+
+    upsert_account(str(registry_path), account_id="proj2", patch={"name": "Project 2"})
+    accounts = load_accounts_registry(str(registry_path))
+    assert sorted(accounts) == ["proj1", "proj2"]
+    assert accounts["proj2"].name == "Project 2"
+
+
+def test_upsert_same_patch_skips_write(tmp_path):
+    from mcp_yandex_ad.accounts_store import upsert_account
+
+    registry_path = tmp_path / "accounts.json"
+    first = upsert_account(str(registry_path), account_id="proj1", patch={"name": "P1"})
+    assert first["created"] is True and "unchanged" not in first
+    mtime = registry_path.stat().st_mtime_ns
+
+    again = upsert_account(str(registry_path), account_id="proj1", patch={"name": "P1"})
+    assert again["unchanged"] is True
+    assert registry_path.stat().st_mtime_ns == mtime
+
+
+def test_read_accounts_file_is_ordered_by_id(tmp_path):
+    from mcp_yandex_ad.accounts_store import read_accounts_file
+
+    registry_path = tmp_path / "accounts.json"
+    registry_path.write_text(json.dumps([{"id": "b"}, {"id": "a"}]), encoding="utf-8")
+    result = read_accounts_file(str(registry_path))
+    assert [a["id"] for a in result["accounts"]] == ["a", "b"]
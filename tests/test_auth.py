@@ -63,7 +63,98 @@ def test_refresh_success(monkeypatch):
     def fake_post(*args, **kwargs):
         return DummyResponse()
 
-    monkeypatch.setattr("mcp_yandex_ad.auth.requests.post", fake_post)
+    monkeypatch.setattr("mcp_yandex_ad.auth._SESSION.post", fake_post)
 
     manager = TokenManager(config)
     assert manager.get_access_token() == "new-token"
+
+
+def test_refresh_persists_token_cache(monkeypatch, tmp_path):
+    cache_file = tmp_path / "token.json"
+    config = _base_config(
+        refresh_token="refresh",
+        client_id="client",
+        client_secret="secret",
+        token_cache_file=str(cache_file),
+    )
+
+    class DummyResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"access_token": "cached-token", "expires_in": 3600}
+
+    monkeypatch.setattr("mcp_yandex_ad.auth._SESSION.post", lambda *a, **k: DummyResponse())
+    assert TokenManager(config).get_access_token() == "cached-token"
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("cached token should skip the refresh request")
+
+    monkeypatch.setattr("mcp_yandex_ad.auth._SESSION.post", fail_post)
+    assert TokenManager(config).get_access_token() == "cached-token"
+
+
+def test_token_cache_ignored_for_other_client(tmp_path):
+    cache_file = tmp_path / "token.json"
+    cache_file.write_text(
+        '{"client_id": "other", "access_token": "foreign", "expires_at": 9999999999}',
+        encoding="utf-8",
+    )
+    config = _base_config(refresh_token="refresh", token_cache_file=str(cache_file))
+    assert TokenManager(config).get_access_token() is None
+
+
+def test_token_cache_ignored_for_other_refresh_token(monkeypatch, tmp_path):
+    cache_file = tmp_path / "token.json"
+    common = dict(client_id="client", client_secret="secret", token_cache_file=str(cache_file))
+
+    class DummyResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"access_token": "token-a", "expires_in": 3600}
+
+    monkeypatch.setattr("mcp_yandex_ad.auth._SESSION.post", lambda *a, **k: DummyResponse())
+    assert TokenManager(_base_config(refresh_token="refresh-a", **common)).get_access_token() == "token-a"
+
+    manager = TokenManager(_base_config(refresh_token="refresh-b", **common))
+    manager._load_cached_token()
+    assert manager._access_token is None
+
+
+def test_concurrent_callers_share_one_refresh(monkeypatch):
+    import threading
+    import time
+
+    config = _base_config(refresh_token="refresh", client_id="client", client_secret="secret")
+    calls = []
+
+    class DummyResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"access_token": "shared-token", "expires_in": 3600}
+
+    def slow_post(*args, **kwargs):
+        calls.append(1)
+        time.sleep(0.05)
+        return DummyResponse()
+
+    monkeypatch.setattr("mcp_yandex_ad.auth._SESSION.post", slow_post)
+    manager = TokenManager(config)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.get_access_token()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["shared-token"] * 4
+    assert len(calls) == 1
@@ -28,6 +28,26 @@ def test_ttl_cache_get_or_set_expires():
     assert calls["count"] == 2
 
 
+def test_ttl_cache_drops_expired_and_caps_size():
+    now = 0.0
+
+    def clock():
+        return now
+
+    cache = TTLCache(10, max_size=2, now=clock)
+    cache.set("a", 1)
+    now = 5.0
+    cache.set("b", 2)
+    cache.set("c", 3)  # cap: evicts "a", the oldest entry
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+    now = 16.0  # "b" and "c" expired
+    cache.set("d", 4)
+    assert len(cache) == 1
+    assert cache.get("d") == 4
+
+
 def test_rate_limiter_sleeps_when_exceeded():
     now = 0.0
     sleeps: list[float] = []
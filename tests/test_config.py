@@ -15,3 +15,30 @@ def test_load_config_direct_api_version(monkeypatch):
     monkeypatch.setenv("YANDEX_DIRECT_API_VERSION", "v501")
     config = load_config()
     assert config.direct_api_version == "v501"
+
+
+def test_load_config_is_cached_per_env_snapshot(monkeypatch):
+    monkeypatch.setenv("YANDEX_DIRECT_API_VERSION", "v5")
+    first = load_config()
+    assert load_config() is first
+    monkeypatch.setenv("YANDEX_DIRECT_API_VERSION", "v501")
+    second = load_config()
+    assert second is not first
+    assert second.direct_api_version == "v501"
+
+
+def test_load_config_picks_up_registry_edits(monkeypatch, tmp_path):
+    registry_path = tmp_path / "accounts.json"
+    registry_path.write_text('{"accounts": [{"id": "a"}]}', encoding="utf-8")
+    monkeypatch.setenv("MCP_ACCOUNTS_FILE", str(registry_path))
+    assert set(load_config().accounts) == {"a"}
+    registry_path.write_text('{"accounts": [{"id": "a"}, {"id": "b"}]}', encoding="utf-8")
+    assert set(load_config().accounts) == {"a", "b"}
+
+
+def test_load_config_tolerates_whitespace(monkeypatch):
+    monkeypatch.setenv("MCP_WRITE_ENABLED", " Yes ")
+    monkeypatch.setenv("YANDEX_METRICA_COUNTER_IDS", " 1, ,2 ,")
+    config = load_config()
+    assert config.write_enabled is True
+    assert config.metrica_counter_ids == ["1", "2"]
@@ -0,0 +1,65 @@
+from mcp_yandex_ad.hf_direct import _apply_first_patch
+
+CANDIDATES = [{"TextCampaign": {}}, {"UnifiedCampaign": {}}, {}]
+
+
+class _Ctx:
+    def __init__(self, accepted: str, *, item_error: str | None = None) -> None:
+        self.hf_patch_shapes: dict[str, int] = {}
+        self.direct_client_login = None
+        self.accepted = accepted
+        self.item_error = item_error
+        self.sent: list[dict] = []
+
+    def _direct_call(self, resource, method, params):
+        item = params["Campaigns"][0]
+        self.sent.append(item)
+        if self.item_error in item:
+            return {"result": {"UpdateResults": [{"Errors": [{"Code": 5008}]}]}}
+        if self.accepted not in item:
+            raise RuntimeError("wrong shape")
+        return {"result": {"UpdateResults": [{"Id": item["Id"]}]}}
+
+
+def _apply(ctx, type_name):
+    return _apply_first_patch(ctx, "campaigns", "Campaigns", "budget", type_name, CANDIDATES, lambda p: {"Id": 1, **p})
+
+
+def test_apply_first_patch_tries_last_accepted_shape_first():
+    ctx = _Ctx("UnifiedCampaign")
+    patch, _ = _apply(ctx, "UNIFIED_CAMPAIGN")
+    assert patch == {"UnifiedCampaign": {}}
+    assert len(ctx.sent) == 2
+
+    ctx.sent.clear()
+    _apply(ctx, "UNIFIED_CAMPAIGN")
+    assert ctx.sent == [{"Id": 1, "UnifiedCampaign": {}}]
+
+
+def test_apply_first_patch_skips_memo_for_unknown_type():
+    ctx = _Ctx("UnifiedCampaign")
+    _apply(ctx, None)
+    assert ctx.hf_patch_shapes == {}
+
+
+def test_apply_first_patch_forgets_shape_rejected_per_item():
+    ctx = _Ctx("UnifiedCampaign", item_error="UnifiedCampaign")
+    ctx.hf_patch_shapes[":budget:TEXT_CAMPAIGN"] = 1
+    ctx.accepted = "TextCampaign"
+
+    patch, result = _apply(ctx, "TEXT_CAMPAIGN")
+    assert patch == {"TextCampaign": {}}
+    assert "Errors" not in result["result"]["UpdateResults"][0]
+    assert ctx.hf_patch_shapes == {":budget:TEXT_CAMPAIGN": 0}
+
+
+def test_budget_by_campaign_id_sends_single_update():
+    from types import SimpleNamespace
+
+    from mcp_yandex_ad.hf_direct import handle
+
+    ctx = _Ctx("TextCampaign")
+    ctx.config = SimpleNamespace(hf_enabled=True, hf_write_enabled=True)
+    handle("direct.hf.set_campaign_budget", ctx, {"campaign_id": 1, "daily_budget_rub": 300, "apply": True})
+    assert len(ctx.sent) == 1
+    assert ctx.hf_patch_shapes == {}
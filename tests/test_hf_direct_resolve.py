@@ -0,0 +1,32 @@
+from mcp_yandex_ad.cache import TTLCache
+from mcp_yandex_ad.hf_direct import _resolve_campaigns
+
+
+class _Ctx:
+    def __init__(self) -> None:
+        self.cache = TTLCache(ttl_seconds=60)
+        self.direct_client_login = None
+        self.direct_write_generation = 0
+        self.calls = 0
+
+    def _direct_get(self, resource, params):
+        self.calls += 1
+        return {"result": {"Campaigns": [{"Id": 1, "Name": "Brand"}, {"Id": 2, "Name": "Other"}]}}
+
+
+def test_resolve_campaigns_is_cached_until_next_write():
+    ctx = _Ctx()
+    assert _resolve_campaigns(ctx, ids=None, name="Brand").ids == [1]
+    assert _resolve_campaigns(ctx, ids=None, name="Brand").ids == [1]
+    assert ctx.calls == 1
+
+    ctx.direct_write_generation += 1
+    _resolve_campaigns(ctx, ids=None, name="Brand")
+    assert ctx.calls == 2
+
+
+def test_resolve_campaigns_does_not_cache_misses():
+    ctx = _Ctx()
+    assert _resolve_campaigns(ctx, ids=None, name="Missing").ids == []
+    _resolve_campaigns(ctx, ids=None, name="Missing")
+    assert ctx.calls == 2
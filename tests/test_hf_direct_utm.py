@@ -0,0 +1,21 @@
+from mcp_yandex_ad.hf_direct import _merge_query, _parse_utm_kv
+
+
+def test_merge_query_keeps_existing_params_verbatim():
+    kv = _parse_utm_kv("?utm_source=yandex&utm_medium=cpc")
+    href = "https://example.com/p?kw={keyword}&utm_source=old#top"
+
+    assert (
+        _merge_query(href, kv, overwrite=False)
+        == "https://example.com/p?kw={keyword}&utm_source=old&utm_medium=cpc#top"
+    )
+    assert (
+        _merge_query(href, kv, overwrite=True)
+        == "https://example.com/p?kw={keyword}&utm_source=yandex&utm_medium=cpc#top"
+    )
+
+
+def test_merge_query_is_noop_when_params_present():
+    href = "https://example.com/?utm_source=yandex&utm_medium=cpc"
+    kv = _parse_utm_kv("utm_source=yandex&utm_medium=cpc")
+    assert _merge_query(href, kv, overwrite=True) == href